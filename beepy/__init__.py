@@ -1,3 +1,6 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from pyodide.ffi import IN_BROWSER
 
 if not IN_BROWSER:
@@ -15,11 +18,35 @@ from beepy.components import Directive
 from beepy.context import SpecialChild
 from beepy.framework import Tag, __version__, empty_tag, mount
 from beepy.listeners import on
-from beepy.style import Style, import_css
-from beepy.tags import Body, Head
+from beepy.tracking import flush_sync
 from beepy.types import Children, safe_html, safe_html_content
 from beepy.utils import __config__
 
+if TYPE_CHECKING:  # at runtime, these are served by `__getattr__` below, so they are listed in `__all__` too
+    from beepy.style import Style, import_css  # noqa: TCH004
+    from beepy.tags import Body, Head  # noqa: TCH004
+
+# declaring of all the tags is the slowest part of import, so they are imported on first usage
+_lazy_exports = {
+    'Head': 'beepy.tags',
+    'Body': 'beepy.tags',
+    'Style': 'beepy.style',
+    'import_css': 'beepy.style',
+}
+
+
+def __getattr__(name):
+    if (module_path := _lazy_exports.get(name)) is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = globals()[name] = getattr(import_module(module_path), name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_exports})
+
+
 __all__ = [
     'Head',
     'Body',
@@ -41,5 +68,6 @@ __all__ = [
     'Children',
     'empty_tag',
     'mount',
+    'flush_sync',
     '__version__',
 ]
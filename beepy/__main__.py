@@ -2,7 +2,10 @@ import pathlib
 
 import click
 
+from beepy.bundle import ARCHIVE_FORMATS, DEFAULT_INCLUDE, create_bundle
 from beepy.dev import DevServer
+from beepy.manifest import MANIFEST_NAME, write_manifest
+from beepy.snapshot import create_snapshot
 from beepy.ssr import create_ssr_dist
 
 DirType = click.Path(exists=True, file_okay=False, path_type=pathlib.Path)
@@ -36,5 +39,49 @@ def build(root_dir, server, index):
     create_ssr_dist(root_dir or pathlib.Path.cwd(), server, index)
 
 
+@main.command()
+@click.option('-d', '--root-dir', default=None, type=DirType, help='Root directory of the app')
+def manifest(root_dir):
+    """Create manifest, so all modules of the app are loaded in parallel at startup"""
+    path = write_manifest(root_dir or pathlib.Path.cwd())
+    print(f'[BeePy] Created {path}. Add <meta name="beepy::config:manifest" content="{MANIFEST_NAME}"> to index.html')
+
+
+@main.command()
+@click.option('-d', '--root-dir', default=None, type=DirType, help='Root directory of the app')
+@click.option('-o', '--output', default=None, type=DirType, help='Directory for the archive  [default: root]')
+@click.option('--format', 'archive_format', default='zip', type=click.Choice(list(ARCHIVE_FORMATS)), show_default=True)
+@click.option(
+    '-i',
+    '--include',
+    multiple=True,
+    default=DEFAULT_INCLUDE,
+    show_default=True,
+    help='Files to pack, glob relative to root; nested directories are matched by "**", e.g. "app/**/*.py"',
+)
+@click.option('--pyc', is_flag=True, help='Add precompiled .pyc files. Requires the same Python version as Pyodide')
+def bundle(root_dir, output, archive_format, include, pyc):
+    """Pack the app into one archive, loaded by one request at startup"""
+    try:
+        path = create_bundle(
+            root_dir or pathlib.Path.cwd(), output, archive_format=archive_format, include=include, pyc=pyc
+        )
+    except ValueError as e:
+        raise click.UsageError(str(e)) from None
+    print(f'[BeePy] Created {path}. Add <meta name="beepy::config:manifest" content="{MANIFEST_NAME}"> to index.html')
+
+
+@main.command()
+@click.option('-d', '--root-dir', default=None, type=DirType, help='Directory, where snapshot will be saved')
+@click.option(
+    '--server', default='http://localhost:8888', show_default=True, help='Base URL of the running BeePy server'
+)
+@click.option('--index', default='/', show_default=True, help='URL of the index page')
+def snapshot(root_dir, server, index):
+    """Build snapshot of the interpreter with installed packages. Requires [ssr] dependency and Pyodide 0.26+"""
+    path = create_snapshot(root_dir or pathlib.Path.cwd(), server, index)
+    print(f'[BeePy] Created {path}.*. Add <meta name="beepy::config:snapshot" content="{path.name}"> to index.html')
+
+
 if __name__ == '__main__':
     main()
@@ -9,12 +9,13 @@ from typing import TYPE_CHECKING, Any, get_type_hints
 from boltons.iterutils import first
 from boltons.typeutils import issubclass
 
-from beepy.types import AttrType, AttrValue
+from beepy import oplog, tracking
+from beepy.types import AttrValue
 from beepy.utils import log
-from beepy.utils.common import NONE_TYPE, call_handler_with_optional_arguments, to_kebab_case, wraps_with_name
+from beepy.utils.common import MISSING, NONE_TYPE, call_handler_with_optional_arguments, to_kebab_case, wraps_with_name
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
     from typing import TypeVar
 
     from beepy.components import Component
@@ -35,13 +36,13 @@ def convert_boolean_attribute_value(value):
 
 def set_html_attribute(el, name: str, value, *, type: builtins.type = NONE_TYPE):
     if value is None:
-        el.removeAttribute(name)
+        oplog.remove_attribute(el, name)
     elif name.endswith('_'):
-        el.setAttribute(name[:-1], value)
+        oplog.set_attribute(el, name[:-1], value)
     elif not hasattr(el, name) or issubclass(type, bool):
-        el.setAttribute(name, value)
+        oplog.set_attribute(el, name, value)
     else:
-        setattr(el, name, value)
+        oplog.set_property(el, name, value)
 
 
 class state:
@@ -55,7 +56,7 @@ class state:
         'enum',
         '_default',
         '_from_model_cache',
-        '_cache',
+        '_index',
     )
 
     name: str | None
@@ -68,7 +69,7 @@ class state:
 
     _default: T
     _from_model_cache: list[tuple[Component, state, str | None]]
-    _cache: dict[Component, AttrType]
+    _index: int | None  # position of value in `Context._values_`, assigned on creation of the first class with it
 
     def __init__(self, default=None, *, required=False, model=None, model_opts=None, enum=None, type=None):
         # TO THINK: add `const` (removed feature)
@@ -90,7 +91,7 @@ class state:
         self.handlers = defaultdict(list)
         self.enum = enum
 
-        self._cache = {}
+        self._index = None
 
     @property
     def _priority(self):
@@ -100,13 +101,58 @@ class state:
     def _order_dict_by_priority(cls, dict_attrs):
         return dict(sorted(dict_attrs.items(), key=lambda item: item[1]._priority))
 
+    @staticmethod
+    def _make_values_layout(states: Iterable[state]) -> tuple[state | None, ...]:
+        """
+        Numbers new states and returns layout of values for the class: `layout[state._index] is state`.
+        If two states of the class have the same number (e.g. from different base classes),
+        the second one isn't in the layout and its values are stored in `Context._extra_values_`
+        """
+        layout: list[state | None] = []
+        new_states = []
+        for attribute in states:
+            if (index := attribute._index) is None:
+                new_states.append(attribute)
+                continue
+
+            if index >= len(layout):
+                layout.extend([None] * (index + 1 - len(layout)))
+            if layout[index] is None:
+                layout[index] = attribute
+
+        free_indexes = iter([index for index, attribute in enumerate(layout) if attribute is None])
+        for attribute in new_states:
+            if attribute._index is not None:  # the same state is set with different names
+                continue
+
+            if (index := next(free_indexes, None)) is None:
+                index = len(layout)
+                layout.append(None)
+            attribute._index = index
+            layout[index] = attribute
+
+        return tuple(layout)
+
+    def _get_index(self, instance: Context) -> int | None:
+        """Position of value in `instance._values_`, or None, if the value is in `instance._extra_values_`"""
+        index = self._index
+        layout = instance._values_layout_
+        if index is not None and index < len(layout) and layout[index] is self:
+            return index
+        return None
+
     def __get__(self, instance, owner=None):
         if instance is None:
             return self
+        tracking.track(instance, self)
         return self._fget(instance)
 
     def _fget(self, instance):
-        return self._cache.get(instance, self._default)
+        if (index := self._get_index(instance)) is None:
+            value = instance._extra_values_.get(self, MISSING)
+        else:
+            value = instance._values_[index]
+        return self._default if value is MISSING else value
 
     def __set__(self, instance, value, *, _prevent_model=False):
         current_value = self.__get__(instance)
@@ -115,6 +161,7 @@ class state:
             return
 
         self._fset(instance, value)
+        tracking.notify(instance, self)
 
         if instance._parent_ is not None:
             for handler in self.handlers['change']:
@@ -129,11 +176,17 @@ class state:
             value._from_model_cache.append((instance, self, value.name))
             instance._kwargs.pop(self.name)
 
-    def _fset(self, instance, value):
+    def _validate(self, value):
         if self.enum is not None and value not in self.enum:
             raise TypeError(f'Possible values: {self.enum}. Provided value: {value}')
 
-        self._cache[instance] = value
+    def _fset(self, instance, value):
+        self._validate(value)
+
+        if (index := self._get_index(instance)) is None:
+            instance._extra_values_[self] = value
+        else:
+            instance._values_[index] = value
 
     def __set_name__(self, owner, name):
         self.name = name
@@ -250,10 +303,14 @@ class state:
                 call_handler_with_optional_arguments(handler, component, {'value': value})
 
     def __delete__(self, instance):
+        tracking.notify(instance, self)
         return self._fdel(instance)
 
     def _fdel(self, instance):
-        self._cache.pop(instance, None)
+        if (index := self._get_index(instance)) is None:
+            instance._extra_values_.pop(self, None)
+        else:
+            instance._values_[index] = MISSING
 
     def __repr__(self):
         return f'{self.name} = {type(self).__name__}(default={self._default!r}, type={self.type})'
@@ -360,19 +417,26 @@ class attr_prop(attr):
 
 
 class state_static(state):
-    __slots__ = ()
+    __slots__ = ('_value',)
+
+    _value: T
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._value = MISSING
 
     def _fget(self, instance):  # noqa: ARG002 - unused `instance`
-        return super()._fget(None)
+        return self._default if self._value is MISSING else self._value
 
     def _fset(self, instance, value):  # noqa: ARG002 - unused `instance`
-        super()._fset(None, value)
+        self._validate(value)
+        self._value = value
 
     def _fdel(self, instance):  # noqa: ARG002 - unused `instance`
         return  # Static state shouldn't be deleted by `__delete__`
 
     def clear(self):
-        super()._fdel(None)
+        self._value = MISSING
 
     def _on_wrapper(self, handler, *, triggers):
         if not hasattr(handler, '_attrs_static_'):
@@ -400,6 +464,7 @@ class html_attr(attr):
         if instance is None:
             return self
 
+        oplog.sync()  # value is stored in the DOM
         el = instance.mount_element
         if hasattr(el, self.name):  # noqa: SIM108 - just want to see difference
             value = getattr(el, self.name, None)
@@ -411,7 +476,8 @@ class html_attr(attr):
     def _fset(self, instance, value):
         if hasattr(instance, 'mount_element'):
             value = self._get_view_value(value=value)
-            set_html_attribute(instance.mount_element, self.name, value, type=self.type)
+            with oplog.paused():  # could be read right after
+                set_html_attribute(instance.mount_element, self.name, value, type=self.type)
 
     def _fdel(self, instance):
         delattr(instance.mount_element, self.name)
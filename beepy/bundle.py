@@ -0,0 +1,105 @@
+import gzip
+import hashlib
+import io
+import json
+import py_compile
+import sys
+import tarfile
+import tempfile
+import zipfile
+from importlib.util import cache_from_source
+from pathlib import Path
+
+from beepy.manifest import MANIFEST_NAME, create_manifest, iter_app_files
+
+PYODIDE_PYTHON_VERSION = (3, 11)  # Python of the default `pyodideVersion` in beepy.js
+ARCHIVE_FORMATS = {'zip': 'zip', 'gztar': 'tar.gz'}  # format for `pyodide.unpackArchive` -> extension
+BUNDLE_PREFIX = 'beepy-bundle.'
+# globs relative to root, `**` is required to match nested directories, so e.g. server-side `backend/` isn't packed
+DEFAULT_INCLUDE = ('*.py', '.env', '**/*.css')
+
+
+def _compile(root: Path, file: str) -> tuple[str, bytes]:
+    """Unchecked hash-based .pyc is used without checking of the source, so mtime of files in FS doesn't matter"""
+    if sys.version_info[:2] != PYODIDE_PYTHON_VERSION:
+        version = '.'.join(map(str, PYODIDE_PYTHON_VERSION))
+        raise ValueError(f'.pyc files must be compiled by Python {version}, the same as in Pyodide')
+
+    with tempfile.TemporaryDirectory() as directory:
+        cfile = Path(directory, 'module.pyc')
+        py_compile.compile(
+            str(root / file),
+            cfile=str(cfile),
+            dfile=file,
+            doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+        return Path(cache_from_source(file)).as_posix(), cfile.read_bytes()
+
+
+def collect_bundle_files(root: Path, include=DEFAULT_INCLUDE, *, pyc=False) -> dict[str, bytes]:
+    """Files of the archive: path in FS -> content. Only files, matched by `include`, are packed"""
+    files = {}
+    for pattern in include:
+        for path in iter_app_files(root, pattern, recursive=False):
+            files.setdefault(path.as_posix(), (root / path).read_bytes())
+
+    if pyc:
+        for file in [file for file in files if file.endswith('.py')]:
+            name, content = _compile(root, file)
+            files[name] = content
+
+    return files
+
+
+def _pack(files: dict[str, bytes], archive_format: str) -> bytes:
+    buffer = io.BytesIO()
+
+    if archive_format == 'zip':
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, content in files.items():
+                archive.writestr(zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0)), content)
+    else:  # mtime is fixed, so the same files give the same hash
+        with (
+            gzip.GzipFile(fileobj=buffer, mode='wb', mtime=0) as compressed,
+            tarfile.open(fileobj=compressed, mode='w') as archive,
+        ):
+            for name, content in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+
+    return buffer.getvalue()
+
+
+def create_bundle(
+    root: Path, output: Path | None = None, *, archive_format='zip', include=DEFAULT_INCLUDE, pyc=False
+) -> Path:
+    """
+    Packs the app into one archive, that is loaded by one request and unpacked to FS at startup.
+    Name of the archive contains hash of its content, so it could be cached forever.
+    Manifest near it points to the archive, previous archives are removed
+    """
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(f'Unknown archive format: {archive_format}. Use one of: {", ".join(ARCHIVE_FORMATS)}')
+
+    output = output or root
+    files = collect_bundle_files(root, include, pyc=pyc)
+
+    manifest = create_manifest(root, [file for file in files if file.endswith('.py')])
+    files[MANIFEST_NAME] = json.dumps(manifest, indent=2).encode()
+
+    content = _pack(files, archive_format)
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    path = output / f'{BUNDLE_PREFIX}{digest}.{ARCHIVE_FORMATS[archive_format]}'
+
+    for old_bundle in output.glob(f'{BUNDLE_PREFIX}*'):
+        old_bundle.unlink()
+    path.write_bytes(content)
+
+    manifest['bundle'] = path.name
+    (output / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+    return path
+
+
+__all__ = ['PYODIDE_PYTHON_VERSION', 'ARCHIVE_FORMATS', 'collect_bundle_files', 'create_bundle']
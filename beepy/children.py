@@ -5,9 +5,10 @@ from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Generic, Self, TypeVar, overload
 
 import beepy
+from beepy import oplog, tracking
 from beepy.components import Component
-from beepy.types import Children, ContentType, Renderer, WebBase
-from beepy.utils import js, log
+from beepy.types import Children, ContentType, Renderer, WebBase, safe_html
+from beepy.utils import __config__, js, log
 from beepy.utils.internal import _py_tag_attribute
 
 if TYPE_CHECKING:
@@ -28,14 +29,29 @@ class StringWrapper(CustomWrapper):
         self.content = string
 
     def __mount__(self, element, parent: Tag, index=None):
-        element.insertChild(self._render(self.content).format(self=parent), index)
+        if parent._template_binding_ is not None and '{' in self.content:
+            parent._template_binding_.dynamic = True  # formatted string could be different for each instance
+        elif parent._prebuilt_:
+            return
+        oplog.insert_child(element, self._render(self.content).format(self=parent), index)
 
     def __repr__(self):
         return f'String({self.content})'
 
 
 class ContentWrapper(CustomWrapper):
-    __slots__ = ('content', 'tag', 'mount_element', '_current_render', 'parent', 'mount_parent', 'children')
+    __slots__ = (
+        'content',
+        'tag',
+        'mount_element',
+        '_current_render',
+        'parent',
+        'mount_parent',
+        'children',
+        '_dirty_',
+        '_html',
+        '_text_node',
+    )
 
     content: Callable[[], ContentType | Tag]
     tag: Tag | None
@@ -44,6 +60,9 @@ class ContentWrapper(CustomWrapper):
     parent: Tag | None
     mount_parent: js.HTMLElement | None
     children: list[Tag] | None
+    _dirty_: bool
+    _html: str | None  # last rendered content, that is in the DOM now
+    _text_node: js.Text | None  # plain text content is updated by `nodeValue`, without parsing of html
 
     def __init__(self, content, tag, _current_render):
         self.content = content
@@ -57,17 +76,30 @@ class ContentWrapper(CustomWrapper):
         self.parent = None
         self.mount_parent = None
         self.children = None
+        self._dirty_ = True
+        self._html = None
+        self._text_node = None
 
     def __mount__(self, element, parent: Tag, index=None):
         self.parent = parent
         self.mount_parent = element
+        self._dirty_ = True
+        self._html = None
+        self._text_node = None
         if self.tag:
-            self.mount_element = self.tag._clone(parent).mount_element
-            self.mount_parent.insertChild(self.mount_element, index)
+            tag = self.tag._clone(parent)
+            self.mount_element = tag.mount_element
+            prebuilt = tag._prebuilt_
         else:
             self.mount_element = js.document.createDocumentFragment()
-            self.mount_parent.insertChild(self.mount_element, index)
-        setattr(self.mount_element, _py_tag_attribute, self)
+            prebuilt = parent._prebuilt_  # empty fragment isn't a part of the template
+
+        if not prebuilt:
+            oplog.insert_child(self.mount_parent, self.mount_element, index)
+        if prebuilt and self.tag:
+            parent._template_binding_.own(self.mount_element, self)
+        else:
+            setattr(self.mount_element, _py_tag_attribute, self)
 
     def _mount_children(self):
         content = self.content()
@@ -93,14 +125,11 @@ class ContentWrapper(CustomWrapper):
             return
 
         if self.tag:
-            element.safeRemoveChild(self.mount_element)
+            oplog.remove_child(element, self.mount_element)
         # TODO: handle shadowRoot and documentFragment?
 
     def __render__(self):
-        for renderer in self._current_render:
-            if self.parent and renderer not in self.parent._dependents:
-                self.parent._dependents.append(renderer)
-
+        self._dirty_ = False
         self._current_render.append(self)
 
         if self.children:
@@ -111,17 +140,39 @@ class ContentWrapper(CustomWrapper):
                 self._current_render.pop()
             return
 
-        result = self._render(self.content())
+        with tracking.reading(self):
+            content = self.content()
+            result = self._render(content)
         if not isinstance(result, str):
             raise TypeError(f'Function {self.content} cannot return {result}!')
 
-        if self.tag:
-            self.mount_element.innerHTML = result
+        if result == self._html:
+            tracking.render_stats.content_skipped += 1
+        elif self.tag:
+            self._update(self.mount_element, content, result)
+        else:
+            self._render_fragment(content, result)
+
+        if self._current_render[-1] is self:
+            self._current_render.pop()
+
+    def _render_fragment(self, content, result: str):
+        """Fragment has no element of its own, so its content replaces content of the parent"""
+        if self._html is not None:  # parent content was replaced by this fragment already
+            self._update(self.mount_parent, content, result)
+        elif not result:  # empty fragment doesn't replace parent content, until it wrote some
+            pass
+        elif oplog.is_recording():  # parent content is compared in JS, after previous mutations are applied
+            tracking.render_stats.content_written += 1
+            oplog.set_html(self.mount_element, result)
+            oplog.replace_html(self.mount_parent, result)
+            self._html = result
         else:  # fragment can't be re-rendered
+            tracking.render_stats.content_written += 1
             self.mount_element.innerHTML = result
             current_html = self.mount_parent.innerHTML
             current_html_escaped = self._render(current_html)
-            if result and result not in (current_html, current_html_escaped):
+            if result not in (current_html, current_html_escaped):
                 if current_html and not (self.parent and self.parent._raw_html):
                     log.warn(
                         f'This html `{current_html}` will be replaces with this: `{result}`.\n'
@@ -129,9 +180,36 @@ class ContentWrapper(CustomWrapper):
                         'or you used incorrect html tags like <br/> instead of <br>',
                     )
                 self.mount_parent.innerHTML = result
+            self._html = result
+
+    def _update(self, element, content, result: str):
+        tracking.render_stats.content_written += 1
+        if not result:
+            oplog.replace_children(element)
+            self._text_node = None
+        elif not self._is_plain_text(content):
+            oplog.set_html(element, result)
+            self._text_node = None
+        else:
+            self._update_text(element, str(content))
+        self._html = result
+
+    def _update_text(self, element, text: str):
+        """Plain text is kept in one text node, so changes are written to its `nodeValue` without parsing"""
+        if self._text_node is None:
+            self._text_node = js.document.createTextNode(text)
+            oplog.replace_children(element, self._text_node)
+        else:
+            oplog.set_property(self._text_node, 'nodeValue', text)
 
-        if self._current_render[-1] is self:
-            self._current_render.pop()
+    @staticmethod
+    def _is_plain_text(content) -> bool:
+        """Content, that is shown the same as text node, so it could be updated without parsing of html"""
+        if isinstance(content, int | float):
+            return True
+        if not isinstance(content, str) or isinstance(content, safe_html):
+            return False
+        return not (__config__['html_replace_whitespaces'] and ('\n' in content or '\t' in content or '  ' in content))
 
     def __repr__(self):
         return f'<{self.parent}.{self.content.__name__}()>'
@@ -141,17 +219,15 @@ C = TypeVar('C')
 
 
 class ChildRef(WebBase, Generic[C]):
-    __slots__ = ('name', 'child', 'inline_def', '_cache')
+    __slots__ = ('name', 'child', 'inline_def')
 
     name: str | None
     child: C
-    _cache: dict[Context, C]
 
     def __init__(self, child: C, *, inline_def=False):
         self.name = None
         self.child = child
         self.inline_def = inline_def
-        self._cache = {}
 
     def __repr__(self):
         return f'{type(self).__name__}(Tag.{self.name} = {self.child})'
@@ -166,17 +242,17 @@ class ChildRef(WebBase, Generic[C]):
         if instance is None:
             return self
 
-        if (result := self._cache.get(instance)) is not None:
+        if (result := instance._extra_values_.get(self)) is not None:
             return result
 
-        self._cache[instance] = self.child
+        instance._extra_values_[self] = self.child
         return self.child
 
     def __set__(self, instance: Context, value: C):
-        self._cache[instance] = value
+        instance._extra_values_[self] = value
 
     def __delete__(self, instance: Context):
-        del self._cache[instance]
+        del instance._extra_values_[self]
 
     def __set_name__(self, owner: type[Tag], name: str):
         self.name = name
@@ -9,9 +9,10 @@ import beepy
 from beepy.attrs import set_html_attribute, state
 from beepy.context import Context, _MetaContext
 from beepy.listeners import on
-from beepy.types import AttrType, Renderer, WebBase
+from beepy.tracking import render_stats
+from beepy.types import AttrType, WebBase
 from beepy.utils import IN_BROWSER, js
-from beepy.utils.common import NONE_TYPE, nested_copy
+from beepy.utils.common import MISSING, NONE_TYPE, nested_copy
 from beepy.utils.dev import _debugger
 
 if TYPE_CHECKING:
@@ -93,18 +94,16 @@ _component_initialized = False
 
 
 class _MetaComponent(_MetaContext):
+    _descriptor_types = (*_MetaContext._descriptor_types, on, LifecycleMethod)
+
     def __new__(mcs, _name: str, bases: tuple, namespace: dict, **kwargs):
         initialized = _component_initialized  # As base classes is also declared here, we must be sure base class exists
 
         static_onchange_handlers = []
-        _lifecycle_methods = []
-
-        base_cls: type[Component] | type = type.__new__(mcs, _name, bases, {})
 
-        for _attribute_name, child in tuple(mcs._clean_namespace(namespace)):
-            if isinstance(child, LifecycleMethod):
-                _lifecycle_methods.append(child.original_fn.__name__)
+        inherited = mcs._get_inherited_descriptors(bases)
 
+        for attribute_name, child in tuple(mcs._clean_namespace(namespace)):
             if initialized and callable(child) and hasattr(child, '_attrs_static_'):
                 _states_with_static_handler = defaultdict(list)
                 for trigger, _states in child._attrs_static_.items():
@@ -113,22 +112,23 @@ class _MetaComponent(_MetaContext):
                         _state.handlers[trigger].remove(child)
                 static_onchange_handlers.append((child, _states_with_static_handler))
 
-        if initialized:
-            for method_name in base_cls._lifecycle_methods:
-                if method := namespace.get(method_name):
-                    # TO THINK: Maybe create base class "AutoInherit" with "_inherit" method?
-                    namespace[method_name] = getattr(base_cls, method_name)._inherit(method)
+            if (
+                initialized
+                and child
+                and not isinstance(child, LifecycleMethod)
+                and isinstance(method := inherited.get(attribute_name), LifecycleMethod)
+            ):
+                # TO THINK: Maybe create base class "AutoInherit" with "_inherit" method?
+                namespace[attribute_name] = method._inherit(child)
 
         cls: type[Component] | type = super().__new__(mcs, _name, bases, namespace, **kwargs)
 
         if initialized:
             cls._static_listeners = defaultdict(list, **nested_copy(cls._static_listeners))
             cls._static_onchange_handlers = cls._static_onchange_handlers.copy() + static_onchange_handlers
-            cls._lifecycle_methods = cls._lifecycle_methods.copy() + _lifecycle_methods
         else:
             cls._static_listeners = defaultdict(list)
             cls._static_onchange_handlers = []
-            cls._lifecycle_methods = _lifecycle_methods
 
         if hasattr(cls, '__extra_attributes__'):
             cls.__extra_attributes__ = {
@@ -140,7 +140,7 @@ class _MetaComponent(_MetaContext):
 
 
 class Component(WebBase, Context, metaclass=_MetaComponent, _root=True):
-    __slots__ = ('_parent_', '_event_listeners', '_dependents', '_listeners', '_handlers', '_ref')
+    __slots__ = ('_parent_', '_event_listeners', '_listeners', '_handlers', '_ref', '_rendered_attrs')
 
     parent: Tag | None
     mount_element: js.HTMLElement | None
@@ -150,11 +150,10 @@ class Component(WebBase, Context, metaclass=_MetaComponent, _root=True):
 
     _event_listeners: defaultdict[str, list[Callable[[js.Event], None]]]
     _static_listeners: defaultdict[str, list[on]]
-    _dependents: list[Renderer]
     _listeners: defaultdict[str, list[on]]
     _handlers: defaultdict[str, list[Callable[[Tag, js.Event, str, Any], None]]]
+    _rendered_attrs: dict[str, AttrType]  # last values of attributes, that were set to the DOM
     _static_onchange_handlers: list[tuple[Callable[[Tag, Any], Any], dict[str, list[state]]]]
-    _lifecycle_methods: list[str]
 
     @LifecycleMethod
     def __mount__(self, *args, **kwargs):
@@ -222,11 +221,16 @@ class Component(WebBase, Context, metaclass=_MetaComponent, _root=True):
         if attrs is None:
             attrs = {}
 
+        rendered_attrs = self._rendered_attrs
         for name, value in {**self._attrs_values, **attrs}.items():
-            # TODO: optimize this - set only changed attributes
+            if rendered_attrs.get(name, MISSING) == value:
+                render_stats.attrs_skipped += 1
+                continue
 
             type = _attr.type if (_attr := self.attrs.get(name)) else NONE_TYPE
             set_html_attribute(self.mount_element, name, value, type=type)
+            rendered_attrs[name] = value
+            render_stats.attrs_written += 1
 
         yield 'post_call'
         yield 'call'
@@ -275,12 +279,13 @@ class Component(WebBase, Context, metaclass=_MetaComponent, _root=True):
         self: Component = super().__new__(cls, *args, **kwargs)
         self._parent_ = None
 
-        self._dependents = []
         self._listeners = defaultdict(list, **nested_copy(self._static_listeners))
         self._event_listeners = defaultdict(list)
         self._handlers = defaultdict(list)
 
         self._ref = None
+        if not hasattr(self, '_rendered_attrs'):  # reused object keeps its element with already rendered attributes
+            self._rendered_attrs = {}
 
         return self
 
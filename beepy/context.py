@@ -2,21 +2,41 @@ from __future__ import annotations
 
 import enum
 from abc import ABCMeta
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Any, Self
 
 import beepy
 from beepy.attrs import attr, html_attr, state, state_move_on
 from beepy.utils import IN_BROWSER, __config__, js
-from beepy.utils.common import get_random_name, log10_ceil, to_kebab_case
+from beepy.utils.common import MISSING, get_random_name, log10_ceil, to_kebab_case
 from beepy.utils.js_py import Interval, create_once_callable
 
 if TYPE_CHECKING:
-    from beepy.types import AttrType
+    from beepy.children import ChildRef
+    from beepy.types import AttrType, Renderer
 
 _base_obj_dir = (*dir(object()), '__abstractmethods__')
 _context_initialized = False
 
 
+def _merge_mro(bases: tuple) -> list[type]:
+    """C3 linearization, the same as `type` does for the new class, but without creating of it"""
+    sequences = [list(base.__mro__) for base in bases or (object,)] + [list(bases)]
+    result = []
+    while sequences := [sequence for sequence in sequences if sequence]:
+        for sequence in sequences:
+            head = sequence[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            raise TypeError(f'Cannot create a consistent method resolution order (MRO) for bases {bases}')
+
+        result.append(head)
+        for sequence in sequences:
+            if sequence[0] is head:
+                del sequence[0]
+    return result
+
+
 class SpecialChild(enum.StrEnum):
     OVERWRITE = 'OVERWRITE'
     SUPER = 'SUPER'
@@ -29,15 +49,15 @@ class _MetaContext(ABCMeta):
     _context_classes = []
     __clean_class_attribute_names = ()
     _current_render = {None: []}  # to prevent ValueError, for now
-    _contexts: list[Context]
+    _contexts_count: int
+    _descriptor_types: tuple[type, ...] = (state,)  # attributes, that are saved to `_descriptors_` table
 
     def __new__(mcs, _name: str, bases: tuple, namespace: dict, **kwargs):
         initialized = _context_initialized  # if class Context is already defined
 
         # used for checking inheritance: attributes, methods, etc.
         # for example: extending classes Tag and WithRouter must produce correct state 'router'
-        # TODO: move this (or part of this) to _MetaContext.__init__
-        base_cls: type[Context] | type = type.__new__(mcs, _name, bases, {})
+        inherited = mcs._get_inherited_descriptors(bases)
 
         namespace = namespace.copy()
         namespace.setdefault('__slots__', ())
@@ -53,11 +73,13 @@ class _MetaContext(ABCMeta):
                 if isinstance(child, state):
                     static_attrs[attribute_name] = child
 
-            for attribute_name, child in mcs._clean_cls_iter(base_cls):
-                new_attr = namespace.get(attribute_name)
-                if attribute_name not in static_attrs and isinstance(child, state):
-                    static_attrs[attribute_name] = child
+            if len(bases) > 1:  # states of the only base are already in its `_static_attrs`
+                for attribute_name, child in inherited.items():
+                    if attribute_name not in static_attrs and isinstance(child, state):
+                        static_attrs[attribute_name] = child
 
+            for attribute_name, new_attr in tuple(namespace.items()):
+                child = inherited.get(attribute_name)
                 if new_attr and (
                     (isinstance(child, state) and not isinstance(new_attr, state))
                     or (isinstance(child, _children.ChildrenRef) and not isinstance(new_attr, _children.ChildrenRef))
@@ -68,7 +90,7 @@ class _MetaContext(ABCMeta):
         ctx_name = '' if is_root else kwargs.get('name')
         namespace['_meta_root'] = is_root
 
-        if ctx_name or (initialized and not hasattr(base_cls, '_context_name_')):
+        if ctx_name or (initialized and not any(hasattr(base, '_context_name_') for base in bases)):
             namespace['_context_name_'] = ctx_name or to_kebab_case(_name)
 
         cls: type[Context] | type = super().__new__(mcs, _name, bases, namespace)
@@ -80,7 +102,9 @@ class _MetaContext(ABCMeta):
             cls._static_attrs = {}
             cls._attrs_defaults = {}
 
-        cls._contexts = []
+        cls._descriptors_ = mcs._merge_descriptors(inherited, namespace)
+        cls._values_layout_ = state._make_values_layout(cls._static_attrs.values())
+        cls._contexts_count = 0
 
         mcs._context_classes.append(cls)
 
@@ -162,11 +186,29 @@ class _MetaContext(ABCMeta):
                 yield key, value
 
     @classmethod
-    def _clean_cls_iter(mcs, cls):
-        base_obj_dir = _base_obj_dir + mcs.__clean_class_attribute_names
-        for key in dir(cls):
-            if key not in base_obj_dir:
-                yield key, getattr(cls, key)
+    def _get_inherited_descriptors(mcs, bases: tuple) -> dict[str, Any]:
+        """
+        Descriptors, available on class with these bases. Table of the only base is reused as is,
+        for multiple inheritance own attributes of all classes in MRO are merged
+        """
+        if len(bases) == 1 and '_descriptors_' in vars(bases[0]):
+            return bases[0]._descriptors_
+
+        descriptors = {}
+        for base in reversed(_merge_mro(bases)):
+            descriptors = mcs._merge_descriptors(descriptors, vars(base))
+        return descriptors
+
+    @classmethod
+    def _merge_descriptors(mcs, inherited: dict[str, Any], namespace) -> dict[str, Any]:
+        """Own attributes of the class override inherited ones, so not descriptors hide inherited descriptors"""
+        descriptors = inherited.copy()
+        for key, value in namespace.items():
+            if isinstance(value, mcs._descriptor_types):
+                descriptors[key] = value
+            elif key in descriptors:
+                del descriptors[key]
+        return descriptors
 
     @classmethod
     def create_onload(mcs):
@@ -187,7 +229,7 @@ class _MetaContext(ABCMeta):
 
 
 class Context(metaclass=_MetaContext, _root=True):
-    __slots__ = ('_id_', '_args', '_kwargs', 'attrs')
+    __slots__ = ('_id_', '_args', '_kwargs', 'attrs', '_subscribers', '_values_', '_extra_values_')
 
     _meta_root = False
 
@@ -196,16 +238,25 @@ class Context(metaclass=_MetaContext, _root=True):
     _kwargs: dict[str, AttrType]
 
     _static_attrs: dict[str, state]
+    _descriptors_: dict[str, Any]  # states, children, listeners and lifecycle methods of the class, including inherited
     _attrs_defaults: dict[str, AttrType]
     attrs: dict[str, state]
+    _subscribers: dict[state, dict[Renderer, None]]
+    _values_layout_: tuple[state | None, ...]
+    _values_: list[AttrType]  # values of states, indexed by `state._index`
+    _extra_values_: dict[state | ChildRef, AttrType]  # values of states, that aren't in `_values_layout_`
     _context_name_: str
 
     def __new__(cls, *args, **kwargs):
-        self = super().__new__(cls)
+        self = cls._allocate_()
         self.attrs = self._static_attrs.copy()
+        self._subscribers = {}
+        self._values_ = [MISSING] * len(cls._values_layout_)
+        self._extra_values_ = {}
 
         # define some attributes here, not in __init__, because they are used for __hash__ method
-        self._id_ = get_random_name(log10_ceil(len(self._contexts) * len(self.__class__._context_classes)))
+        if not hasattr(self, '_id_'):  # reused object keeps its hash, it could be still used as a key
+            self._id_ = get_random_name(log10_ceil(self._contexts_count * len(self.__class__._context_classes)))
         self._args = args
         self._kwargs = kwargs
 
@@ -217,6 +268,11 @@ class Context(metaclass=_MetaContext, _root=True):
 
         return self
 
+    @classmethod
+    def _allocate_(cls) -> Self:
+        """Creates empty object of the class, could be overridden to reuse objects"""
+        return super().__new__(cls)
+
     def _clone_link_parent(self, parent):
         for name, attribute in self.attrs.items():
             if name in self._kwargs:
@@ -233,7 +289,7 @@ class Context(metaclass=_MetaContext, _root=True):
                     self._attrs_defaults[name] = p_data[name]
 
     def __init__(self, *args, **kwargs: AttrType):
-        self.__class__._contexts.append(self)
+        self.__class__._contexts_count += 1
         data = self._attrs_defaults | kwargs
         self.init(*args, **data)
 
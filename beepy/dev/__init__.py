@@ -17,6 +17,7 @@ from watchdog.observers import Observer
 from websockets.exceptions import ConnectionClosedOK
 from websockets.server import serve
 
+from beepy.manifest import MANIFEST_NAME, write_manifest
 from beepy.ssr import get_server_html
 
 dotenv.load_dotenv()
@@ -31,7 +32,7 @@ class MonitorFolder(FileSystemEventHandler):
         if not (
             event.event_type in ('opened', 'closed')
             or event.is_directory
-            or event.src_path.endswith(('~', '.tmp'))
+            or event.src_path.endswith(('~', '.tmp', MANIFEST_NAME))
             or re.search(r'/(__pycache__|.git|.idea|dist|build)/', event.src_path)
         ):
             self.server._handle_file_event(event)
@@ -91,6 +92,8 @@ class DevServer:
         path: str = event.src_path.removeprefix(str(self.root)).removeprefix('/')
 
         print(f'[BeePy] Found file change: {path}')
+        if path.endswith('.py') and (self.root / MANIFEST_NAME).exists():
+            write_manifest(self.root)
         if self.developer_mode:
             if path.endswith('.py'):
                 subprocess.call('hatch build', shell=True)
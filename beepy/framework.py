@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 import traceback
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from functools import cache
 from types import MethodType
 from typing import TYPE_CHECKING
 
+from beepy import oplog, tracking
 from beepy.attrs import state, state_move_on
 from beepy.children import ChildRef, Children, ContentWrapper, CustomWrapper, StringWrapper, TagRef
 from beepy.components import Component, _MetaComponent
 from beepy.context import SpecialChild
 from beepy.types import AttrType, ContentType, Mounter, Renderer
-from beepy.utils import __config__, js, log
+from beepy.utils import __config__, js, log, to_js
 from beepy.utils.common import NONE_TYPE, get_random_name, to_kebab_case
 from beepy.utils.dev import _debugger
 from beepy.utils.internal import _py_tag_attribute
@@ -26,9 +27,88 @@ __config__['version'] = __version__
 _tag_initialized = False
 
 
+class PoolStats:
+    """Counters of the pool of Tag class, see `pool=` argument of Tag class"""
+
+    __slots__ = ('reused', 'missed', 'released', 'remounted')
+
+    reused: int  # instances, taken from the pool
+    missed: int  # instances, created while the pool was empty
+    released: int  # removed instances, put to the pool and not mounted again directly
+    remounted: int  # removed instances, taken back from the pool by direct mount, so not reused
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.reused = 0
+        self.missed = 0
+        self.released = 0
+        self.remounted = 0
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f'PoolStats({", ".join(f"{key}={value}" for key, value in self.as_dict().items())})'
+
+
+class _TemplateBinding:
+    """
+    Elements of static subtree of Tag with `template=True`: taken from the clone of its template,
+    or created as usual and recorded, while the first instance is mounted, to compile the template
+    """
+
+    __slots__ = ('root', 'recording', 'tags', 'elements', 'owners', 'dynamic')
+
+    root: Tag
+    recording: bool
+    tags: list[Tag]  # recorded Tags, in order of creation
+    elements: Iterator[js.HTMLElement | None]  # cloned elements, `None` for elements outside of the template
+    owners: list[tuple[js.HTMLElement, Any]]  # Python objects of cloned elements, are linked after mount at once
+    dynamic: bool  # subtree depends on instance, e.g. has Children, so it can't be compiled
+
+    def __init__(self, root: Tag, elements: Iterable[js.HTMLElement | None] | None = None):
+        self.root = root
+        self.recording = elements is None
+        self.tags = []
+        self.elements = iter(elements or ())
+        self.owners = []
+        self.dynamic = False
+
+    def take(self, tag: Tag) -> js.HTMLElement | None:
+        """Element for static child Tag, or `None` if it must be created as usual"""
+        if self.recording:
+            self.tags.append(tag)
+        return next(self.elements, None)
+
+    def own(self, element: js.HTMLElement, owner: Any):
+        self.owners.append((element, owner))
+
+    def finish(self):
+        """Compiles template from the recorded subtree or links Python objects to the cloned elements"""
+        cls = type(self.root)
+        if self.recording and not self.dynamic and not cls._compiled_template:
+            oplog.sync()
+            cls._compiled_template = js.beepy.compileTemplate(
+                self.root.mount_element, to_js([tag.mount_element for tag in self.tags])
+            )
+        elif self.owners:
+            elements, owners = zip(*self.owners, strict=True)
+            js.beepy.bindTemplate(to_js(list(elements)), to_js(list(owners)))
+
+        # subtree could be mounted again, then elements are created as usual
+        self.recording = False
+        self.tags = []
+        self.owners = []
+
+
 class _MetaTag(_MetaComponent):
     _tag_classes: list[type[Tag]] = []
+    _template_binding: _TemplateBinding | None = None  # binding of Tag, that is being cloned as static child
+    _cloning: bool = False  # Tag is being cloned, so it takes children of the original instead of its arguments
     __clean_class_attribute_names = ('_content_tag', '_static_children_tag')
+    _descriptor_types = (*_MetaComponent._descriptor_types, ChildRef)
 
     def __new__(mcs, _name: str, bases: tuple, namespace: dict, **kwargs):  # noqa: PLR0912, PLR0915, C901
         namespace = namespace.copy()
@@ -38,7 +118,7 @@ class _MetaTag(_MetaComponent):
 
         # used for checking inheritance: attributes, methods, etc.
         # for example: extending classes Tag and WithRouter must produce correct state 'router'
-        mock_cls: type[Tag] | type = type.__new__(mcs, _name, bases, {})
+        inherited = mcs._get_inherited_descriptors(bases)
 
         initialized = _tag_initialized  # As base classes is also declared here, we must be sure base class exists
 
@@ -46,7 +126,7 @@ class _MetaTag(_MetaComponent):
         tag_name = '' if is_root else kwargs.get('name')
         namespace['_meta_root'] = is_root
 
-        if tag_name or (initialized and not hasattr(mock_cls, '_tag_name_')):
+        if tag_name or (initialized and not any(hasattr(base, '_tag_name_') for base in bases)):
             namespace['_tag_name_'] = to_kebab_case(tag_name or _name)
 
         if 'raw_html' in kwargs:
@@ -55,6 +135,12 @@ class _MetaTag(_MetaComponent):
         if 'force_ref' in kwargs:
             namespace['_force_ref'] = kwargs['force_ref']
 
+        if 'pool' in kwargs:
+            namespace['_pool_size'] = kwargs['pool']
+
+        if 'template' in kwargs:
+            namespace['_template'] = kwargs['template']
+
         if 'mount' in kwargs:
             namespace['mount_element'] = kwargs['mount']
 
@@ -101,7 +187,7 @@ class _MetaTag(_MetaComponent):
                     if child in children_arg:
                         ref_children.append(child)
                         # TODO: make possible inherit without replacement?
-                        if (old_child := getattr(mock_cls, attribute_name, None)) and isinstance(old_child, ChildRef):
+                        if isinstance(old_child := inherited.get(attribute_name), ChildRef):
                             to_remove_children.append(old_child)
                         if isinstance(child, Component | Children):
                             children_arg[children_arg.index(child)] = namespace[attribute_name] = child._as_child(None)
@@ -157,6 +243,9 @@ class _MetaTag(_MetaComponent):
             cls._static_children = [SpecialChild.CONTENT]
 
         cls._tags = []
+        cls._pool = []
+        cls.pool_stats = PoolStats()
+        cls._compiled_template = None
 
         mcs._tag_classes.append(cls)
 
@@ -181,6 +270,10 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
         '_children',
         '_children_element',
         '_children_tag',
+        '_dirty_',
+        '_in_pool_',
+        '_template_binding_',
+        '_prebuilt_',
     )
 
     _root_parent: Tag = None  # see function mount in the bottom
@@ -190,6 +283,11 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
     _content: ContentType
     _ref: TagRef | None
     _force_ref: bool = False
+    _pool_size: int = 0  # max count of removed instances, kept for reuse; `class Row(Tag, pool=100)` enables it
+    _pool: list[Tag]
+    pool_stats: PoolStats
+    _template: bool = False  # static subtree is cloned from the template; `class Card(Tag, template=True)` enables it
+    _compiled_template: js.HTMLElement | None
 
     _tag_name_: str
     _tags: list[Tag]
@@ -201,6 +299,10 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
     _static_children_tag: Tag
     _children_tag: Tag
     _mount_finished_: bool
+    _dirty_: bool
+    _in_pool_: bool
+    _template_binding_: _TemplateBinding | None
+    _prebuilt_: bool  # element is cloned from the template together with its parent, so it's already inserted
 
     children: ClassVar[Component | state | SpecialChild | str]
 
@@ -213,9 +315,16 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
         """This method is called, when common Tag is defined"""
 
     def __mount__(self, *args, **kwargs):
+        if self._in_pool_:  # mounted again after removal, so it mustn't be reused
+            self._in_pool_ = False
+            self.__class__._pool.remove(self)
+            self.__class__.pool_stats.released -= 1
+            self.__class__.pool_stats.remounted += 1
+
         self.__class__._tags.append(self)
 
         self._mount_finished_ = False
+        self._dirty_ = True
 
         result = yield 'call'
         yield 'attrs'
@@ -228,20 +337,25 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
             else:
                 log.warn(f'Cannot mount: {child}')
 
-        if self._children_tag:
-            self.mount_element.insertChild(self._children_element)
+        if self._children_tag and not (self._prebuilt_ and self._children_tag._prebuilt_):
+            oplog.insert_child(self.mount_element, self._children_element)
 
         if (content_child := self._get_content_child()) is None:
             _debugger(self)  # wtf?
         else:
             content_child._mount_children()
 
+        self._prebuilt_ = False
+
         super().__mount__.call_as_super(self, args, kwargs)
 
         self._mount_finished_ = True
 
         yield 'post_call'
 
+        if self._template_binding_ is not None and self._template_binding_.root is self:
+            self._template_binding_.finish()  # after `mount`, as it also could add children
+
         return result
 
     def __unmount__(self, *args, **kwargs):
@@ -258,30 +372,50 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
             elif isinstance(child, Mounter):
                 child.__unmount__(self._children_element, self)
         if self._children_tag:
-            self.mount_element.safeRemoveChild(self._children_element)
+            oplog.remove_child(self.mount_element, self._children_element)
 
         result = yield 'call'
         yield 'post_call'
         return result
 
     def __render__(self, *args, **kwargs):
+        oplog.sync_moves()
         if not self._mount_finished_ or (
             not self.mount_element.parentElement and self._root_parent != self  # dismounted
         ):
             return  # Prevent render before mount finished; Could be useful for setting intervals inside mount method
 
-        yield from super().__render__.original_fn(self, *args, **kwargs)
+        explicit = not tracking.is_rendering()
+        if explicit:  # called directly, not by render pass of parent, so own content must be re-rendered anyway
+            self._mark_content_dirty()
+        elif not self._dirty_:
+            tracking.render_stats.skipped += 1
+            return
+
+        self._dirty_ = False
+        tracking.render_stats.rendered += 1
+        with oplog.recording():
+            with tracking.reading(self):
+                yield from super().__render__.original_fn(self, *args, **kwargs)
+
+            if explicit:
+                tracking.flush_sync()
 
     def __init__(self, *args, **kwargs: AttrType):
         kwargs.setdefault('_load_children', False)
         super().__init__(*args, **kwargs)
 
     def __new__(cls, *args, **kwargs):  # noqa: PLR0915, PLR0912, C901 - Statements (60 > 50)  +  Branches (23 > 12)
+        cloning, _MetaTag._cloning = _MetaTag._cloning, False
+
         if hasattr(getattr(cls, 'mount_element', None), _py_tag_attribute):
             return getattr(cls.mount_element, _py_tag_attribute)
 
         self: Tag = super().__new__(cls, *args, **kwargs)
 
+        # must be taken before children arguments are cloned, so elements are taken in order of recording
+        element = self._take_template_element(args, kwargs)
+
         self._children = self._static_children.copy()
         self._content = self._static_content
 
@@ -317,6 +451,8 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
                 self._content = children_argument
             elif is_child_arg_function and children_argument and len(children_argument) == 1:
                 self._content = MethodType(children_argument[0], self)
+            elif is_child_arg_tag and cloning:
+                pass  # clones of Tags from arguments would be discarded, as `_clone` sets children of the original
             elif is_child_arg_tag:
                 self._children = self._children.copy() + [
                     child._clone(self)._as_child(self) for child in children_argument
@@ -335,23 +471,92 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
 
         self.mount_parent = None
         self._mount_finished_ = False
+        self._dirty_ = True
+        self._in_pool_ = False
 
-        if not hasattr(self, 'mount_element'):
-            self.mount_element = js.document.createElement(self._tag_name_)
-        if getattr(self.mount_element, _py_tag_attribute, None):
-            raise ValueError(f'Coping or using as child is not allowed for "{self._tag_name_}"')
+        if element is not None:
+            self.mount_element = element
+            self._rendered_attrs = {}  # Tag from the pool gets new element
+            self._template_binding_.own(element, self)
         else:
-            setattr(self.mount_element, _py_tag_attribute, self)
+            if not hasattr(self, 'mount_element'):
+                self.mount_element = js.document.createElement(self._tag_name_)
+            if (owner := getattr(self.mount_element, _py_tag_attribute, None)) is None:
+                setattr(self.mount_element, _py_tag_attribute, self)
+            elif owner is not self:  # Tag from the pool keeps its element
+                raise ValueError(f'Coping or using as child is not allowed for "{self._tag_name_}"')
         if self._static_children_tag:
             self._children_tag = self._static_children_tag._clone(self)
             self._children_element = self._children_tag.mount_element
-            setattr(self._children_element, _py_tag_attribute, self)
+            if self._children_tag._prebuilt_:
+                self._template_binding_.own(self._children_element, self)
+            else:
+                setattr(self._children_element, _py_tag_attribute, self)
         else:
             self._children_tag = None
             self._children_element = self.mount_element
 
         return self
 
+    def _take_template_element(self, args: tuple, kwargs: dict) -> js.HTMLElement | None:
+        """
+        Static child of Tag with template takes next cloned element. Tag with `template=True` clones its template,
+        if children of the instance can't change the subtree, or starts recording, if template isn't compiled yet
+        """
+        cls = type(self)
+        self._prebuilt_ = False
+
+        if (binding := _MetaTag._template_binding) is not None:
+            _MetaTag._template_binding = None
+            self._template_binding_ = binding
+            element = binding.take(self)
+            self._prebuilt_ = element is not None
+            return element
+
+        self._template_binding_ = None
+        if (
+            not cls._template
+            or cls._static_children_tag
+            or 'children' in kwargs
+            or len(args) > 1
+            or (args and not isinstance(args[0], str))
+            or any(isinstance(value, Component | Children) for value in kwargs.values())
+        ):
+            return None
+
+        if not cls._compiled_template:
+            self._template_binding_ = _TemplateBinding(self)
+            return None
+
+        element, *elements = js.beepy.cloneTemplate(cls._compiled_template)
+        self._template_binding_ = _TemplateBinding(self, elements)
+        self._prebuilt_ = True
+        return element
+
+    @classmethod
+    def _allocate_(cls) -> Tag:
+        if cls._pool:
+            cls.pool_stats.reused += 1
+            return cls._pool.pop()
+
+        if cls._pool_size:
+            cls.pool_stats.missed += 1
+        return super()._allocate_()
+
+    def _release_(self):
+        """
+        Puts removed Tag to the pool of its class, if it's enabled, so the next instance reuses object and DOM element.
+        Removed Tag must not be used after that: it will be reset and mounted to other place
+        """
+        cls = type(self)
+        if self._in_pool_ or len(cls._pool) >= cls._pool_size:
+            return
+
+        oplog.replace_children(self.mount_element)  # content isn't removed on unmount
+        self._in_pool_ = True
+        cls._pool.append(self)
+        cls.pool_stats.released += 1
+
     def __repr__(self):
         return f'{type(self).__name__}(<{self._tag_name_}/>, id#{self._id_})'
 
@@ -375,7 +580,7 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
 
     def __notify__(self, attr_name: str, attribute: state, value: AttrType):
         super().__notify__(attr_name, attribute, value)
-        self.__render__()
+        self._request_render()
 
     def _set_ref(self, parent: Tag | None, ref: TagRef):
         super()._set_ref(parent, ref)
@@ -387,15 +592,14 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
 
         content_index = self._get_content_index()
         if content_index is not None:
-            self.children[content_index].__render__()
+            self._render_wrapper(self.children[content_index])
 
         for index, child in enumerate(self.children):
-            # TODO: optimize this - re-render the only children, that need this
-            if isinstance(child, ChildRef):
+            if isinstance(child, ChildRef):  # Tags are skipped in __render__, if they are not dirty
                 child.__render__(self)
-            elif isinstance(child, CustomWrapper):
+            elif isinstance(child, ContentWrapper):
                 if content_index is None or index != content_index:
-                    child.__render__()
+                    self._render_wrapper(child)
             elif isinstance(child, Renderer):
                 child.__render__()
             else:  # string ?
@@ -404,6 +608,24 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
         if self._current_render[-1] is self:
             self._current_render.pop()
 
+    @staticmethod
+    def _render_wrapper(wrapper: ContentWrapper):
+        if wrapper._dirty_ or wrapper.children:  # children of wrapper are checked separately
+            wrapper.__render__()
+        else:
+            tracking.render_stats.skipped += 1
+
+    def _mark_content_dirty(self):
+        self._dirty_ = True
+        for child in self.children:
+            if isinstance(child, ContentWrapper):
+                child._dirty_ = True
+
+    def _request_render(self):
+        """Re-render Tag with its own content on the next flush, see `beepy.flush_sync`"""
+        self._mark_content_dirty()
+        tracking.mark_dirty(self)
+
     def content(self) -> ContentType:
         return self._content() if callable(self._content) else self._content
 
@@ -423,9 +645,15 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
     def _mount_(self, element, parent: Tag, index=None):
         self.mount_parent = element
 
+        binding = self._template_binding_
+        parent_binding = getattr(parent, '_template_binding_', None)
+        if parent_binding is not None and parent_binding is not binding:
+            parent_binding.dynamic = True  # not a static child, so the subtree of parent isn't the same for instances
+
         super()._mount_(element, parent, index=index)
 
-        self.mount_parent.insertChild(self.mount_element, index)
+        if not (self._prebuilt_ and parent_binding is binding):
+            oplog.insert_child(self.mount_parent, self.mount_element, index)
 
     def _unmount_(self, element, parent, *, _unsafe=False):
         if not _unsafe and self.mount_parent is not None and self.mount_parent is not element:
@@ -436,7 +664,7 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
             )
             log.warn(''.join(traceback.format_stack()[:-1]))
 
-        (self.mount_parent or element).safeRemoveChild(self.mount_element)
+        oplog.remove_child(self.mount_parent or element, self.mount_element)
 
     @property
     def own_children(self) -> list[Mounter]:
@@ -497,10 +725,24 @@ class Tag(Component, metaclass=_MetaTag, _root=True):
         self._children = result
 
     def _clone(self, parent=None):
-        clone = super()._clone(parent=parent)
+        _MetaTag._template_binding = getattr(parent, '_template_binding_', None)  # is taken by the clone
+        _MetaTag._cloning = True
+        try:
+            clone = super()._clone(parent=parent)
+        finally:
+            _MetaTag._template_binding = None
+            _MetaTag._cloning = False
         clone._children = self.children
         return clone
 
+    def _reuse_as(self, other: Tag):
+        """Takes content and states from other Tag, used for keyed children instead of re-mounting"""
+        self._content = other._content
+        self._args, self._kwargs = other._args, other._kwargs
+        if self._mount_finished_:
+            self.init(*self._args, _load_children=False, **(self._attrs_defaults | self._kwargs))
+            self._request_render()
+
     @property
     def _current_render(self):
         try:
@@ -551,4 +793,4 @@ def mount(element: Tag, root_element: str, *, clear=False):
         log.warn(f'Document title is not set, use default title: {js.document.title}')
 
 
-__all__ = ['__version__', '_MetaTag', 'Tag', 'empty_tag', 'mount']
+__all__ = ['__version__', '_MetaTag', 'PoolStats', 'Tag', 'empty_tag', 'mount']
@@ -6,8 +6,10 @@ from functools import partial, wraps
 from types import MethodType
 from typing import TYPE_CHECKING, Any
 
+import beepy
+from beepy import tracking
 from beepy.utils import js, to_js
-from beepy.utils.common import nested_copy
+from beepy.utils.common import get_optional_arguments, nested_copy
 from beepy.utils.internal import _py_tag_attribute
 from beepy.utils.js_py import create_proxy
 
@@ -88,8 +90,7 @@ class on:
         self._callback = method
         self._child_restrict = child
 
-        sig = inspect.signature(method)
-        self._pass_event = 'event' in sig.parameters
+        self._pass_event = bool(get_optional_arguments(method, ('event',)))
         return self
 
     def _get_cb_and_instance(self, cmpt):
@@ -139,11 +140,13 @@ class on:
         return data
 
     def _after_call(self, cmpt, event):
-        for dependent in cmpt._dependents:
-            # TODO: move to other place
-            dependent.__render__()
-
-        getattr(event.currentTarget, _py_tag_attribute, cmpt).__render__()
+        target = getattr(event.currentTarget, _py_tag_attribute, cmpt)
+        if isinstance(target, beepy.framework.Tag):
+            target._request_render()
+        elif isinstance(target, beepy.children.ContentWrapper):
+            tracking.mark_dirty(target)
+        else:  # Component without own content, e.g. Directive
+            target.__render__()
 
     def _make_listener(self, event_name: str, cmpt: Component):
         if inspect.iscoroutinefunction(self._callback):
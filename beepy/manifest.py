@@ -0,0 +1,43 @@
+import hashlib
+import json
+from pathlib import Path
+
+MANIFEST_NAME = 'beepy-manifest.json'
+_IGNORED_DIRECTORIES = frozenset(('__pycache__', 'node_modules', 'dist', 'build', 'venv'))
+
+
+def _is_ignored(relative: Path) -> bool:
+    return any(part.startswith('.') or part in _IGNORED_DIRECTORIES for part in relative.parts[:-1])
+
+
+def iter_app_files(root: Path, pattern='*.py', *, recursive=True):
+    """Files of the app, that are loaded by the browser. Hidden directories and build results are skipped"""
+    for path in sorted(root.rglob(pattern) if recursive else root.glob(pattern)):
+        relative = path.relative_to(root)
+        if path.is_file() and not _is_ignored(relative):
+            yield relative
+
+
+def create_manifest(root: Path, files: list[str] | None = None) -> dict:
+    """
+    List of files of the app, so browser loads all of them in parallel at startup, instead of synchronous request
+    on every import. `version` is changed, when any file is changed
+    """
+    if files is None:
+        files = [path.as_posix() for path in iter_app_files(root)]
+
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(file.encode())
+        digest.update((root / file).read_bytes())
+
+    return {'version': digest.hexdigest()[:12], 'files': files}
+
+
+def write_manifest(root: Path, name: str = MANIFEST_NAME) -> Path:
+    path = root / name
+    path.write_text(json.dumps(create_manifest(root), indent=2))
+    return path
+
+
+__all__ = ['MANIFEST_NAME', 'iter_app_files', 'create_manifest', 'write_manifest']
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import Literal, TypeVar
 
-from beepy import Children, Style, on, state
+from beepy import Children, Style, Tag, html_attr, on, state
+from beepy.children import TagRef
 from beepy.modules.actions import Action
+from beepy.modules.virtual import VirtualWindow
 from beepy.tags import table, tbody, td, th, thead, tr
 from beepy.utils.asyncio import ensure_sync_many
 from beepy.utils.common import call_handler_with_optional_arguments
@@ -53,6 +55,8 @@ class TD(td):
 
 
 class TR(tr):
+    __slots__ = ('_lines',)
+
     data = state(type=list[dict[str, str]])
 
     parent: TableHead | TableBody
@@ -61,6 +65,12 @@ class TR(tr):
         _data := Children(),  # TODO: add auto-reload data, instead of `sync` functions
     ]
 
+    _lines: list
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lines = []
+
     @property
     def raw_data(self):
         return [line['value'] for line in self.data if isinstance(line, dict)]
@@ -69,9 +79,22 @@ class TR(tr):
     def view_data(self):
         return [(line['view'] if isinstance(line, dict) else line) for line in self.data]
 
+    @staticmethod
+    def _make_cell(line):
+        return TD(str(line['view'])) if isinstance(line, dict) else TD(*line)
+
     @data.on('mount', 'change')
     def sync(self):
-        self._data[:] = [(TD(str(line['view'])) if isinstance(line, dict) else TD(*line)) for line in self.data]
+        cells = list(self._data)
+        if len(cells) != len(self._lines):  # cells are not created from the current lines
+            cells = []
+
+        # only cells with changed data are re-created
+        self._data[:] = [
+            cells[index] if index < len(cells) and self._lines[index] == line else self._make_cell(line)
+            for index, line in enumerate(self.data)
+        ]
+        self._lines = list(self.data)
 
 
 class TableHead(thead, children_tag=TR(), force_ref=True):
@@ -105,28 +128,141 @@ class TableBody(tbody, force_ref=True):
     ]
 
     @rows.on('mount', 'change')
+    def _rows_changed(self):
+        self.sync()
+
     def sync(self):
         if self._parent_ is None:
             return
 
-        self._rows[:] = [
-            TR(
-                data=[
-                    *(
-                        {'value': cell, 'view': col['view'](cell).__view_value__() if 'view' in col else cell}
-                        for col, cell in self.parent._zip_column_row(row)
-                    ),
-                    [TableCellAction.components[action]() for action in self.parent.actions],
-                ],
-            )
-            for row in self.rows
+        self._rows[:] = [self._make_row(row) for row in self.rows]
+
+    def _row_data(self, row, actions=None):
+        if actions is None:
+            actions = [TableCellAction.components[action]() for action in self.parent.actions]
+        return [
+            *(
+                {'value': cell, 'view': col['view'](cell).__view_value__() if 'view' in col else cell}
+                for col, cell in self.parent._zip_column_row(row)
+            ),
+            actions,
         ]
 
+    def _make_row(self, row, _index=None):
+        return TR(data=self._row_data(row))
+
     def delete_row(self, index):
         self.rows.pop(index)
         self._rows.pop(index)
 
 
+class TableSpacerCell(td):
+    colspan = html_attr(1, type=int)
+
+    def mount(self):
+        self.mount_element.style.setProperty('padding', '0')
+        self.mount_element.style.setProperty('border', 'none')
+
+
+class TableSpacer(tr):
+    """Row in place of not mounted rows of `VirtualTableBody`, its height is set to height of these rows"""
+
+    children = [
+        cell := TableSpacerCell(),
+    ]
+
+
+class VirtualTableBody(TableBody, force_ref=True):
+    """
+    Table body, that mounts only visible rows. Table must be inside `TableScroll`, that is scrolled,
+    and all rows must have the same height `row_height` in pixels.
+    Not mounted rows are replaced with spacer rows, so the table keeps its layout.
+    `Table.find_row` and `Table.delete_row` still work with all rows
+    """
+
+    __slots__ = ('_window',)
+
+    row_height = state(33)
+    overscan = state(5)
+
+    children = [
+        _space_before := TableSpacer(),
+        _rows := Children(),
+        _space_after := TableSpacer(),
+    ]
+
+    _window: VirtualWindow | None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._window = None
+
+    def sync(self):
+        if self._parent_ is None:
+            return
+
+        self._window = VirtualWindow(self.row_height, self._make_row, self._update_row, self.overscan)
+        self._update_window(force=True)
+
+    def _update_row(self, tr_: TR, row, _index):
+        # action components of the row are re-used, so the data of the row is changed only with its cells
+        tr_.data = self._row_data(row, tr_.data[-1])
+
+    def _update_window(self, *, force=False):
+        if self._window is None:
+            return
+
+        scroll = self.parent._parent_
+        if not isinstance(scroll, TableScroll):
+            return
+
+        el = scroll.mount_element
+        if self._window.update(
+            self._rows,
+            self.rows,
+            scroll_top=el.scrollTop or 0,
+            viewport_height=el.clientHeight or scroll.height,
+            force=force,
+        ):
+            self._update_spacers()
+
+    def _update_spacers(self):
+        columns = len(self.parent.head.columns) + bool(self.parent.actions)
+        self._space_before.cell.colspan = self._space_after.cell.colspan = columns
+        self._window.apply_spacers(
+            self._space_before.cell.mount_element, self._space_after.cell.mount_element, len(self.rows)
+        )
+
+    def delete_row(self, index):
+        self.rows.pop(index)
+        self._update_window(force=True)
+
+
+class TableScroll(Tag, name='table-scroll'):
+    """
+    Scroll container around the `Table` with `VirtualTableBody`
+
+    >>> TableScroll(UsersTable(), height=600)
+    """
+
+    height = state(400)
+
+    default_style = Style(
+        display='block',
+        overflow_y='auto',
+        height='{height}px',
+    )
+
+    @on('scroll')
+    def _on_scroll(self):
+        for child in self.children:
+            if not isinstance(child, TagRef):
+                continue
+            table_ = child.__get__(self)
+            if isinstance(table_, Table) and isinstance(table_.body, VirtualTableBody):
+                table_.body._update_window()
+
+
 class Table(table):
     actions = ('edit', 'delete')
 
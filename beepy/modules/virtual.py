@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from beepy import Children, Style, Tag, on, state
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+class VirtualWindow:
+    """
+    Calculates, which rows of the long list are visible in the scrolled element,
+    and re-uses already mounted row Tags, when the window is moved
+    """
+
+    __slots__ = ('row_height', 'make_row', 'update_row', 'overscan', 'start', 'stop')
+
+    row_height: int
+    make_row: Callable[[Any, int], Tag]
+    update_row: Callable[[Tag, Any, int], None]
+    overscan: int
+    start: int
+    stop: int
+
+    def __init__(
+        self,
+        row_height: int,
+        make_row: Callable[[Any, int], Tag],
+        update_row: Callable[[Tag, Any, int], None],
+        overscan: int = 5,
+    ):
+        self.row_height = row_height
+        self.make_row = make_row
+        self.update_row = update_row
+        self.overscan = overscan
+        self.start = self.stop = 0
+
+    def get_range(self, scroll_top: float, viewport_height: float, total: int) -> tuple[int, int]:
+        first_visible = int(scroll_top // self.row_height)
+        visible_count = int(viewport_height // self.row_height) + 1
+        start = max(0, first_visible - self.overscan)
+        stop = min(total, first_visible + visible_count + self.overscan)
+        return start, max(start, stop)
+
+    def space_before(self) -> int:
+        return self.start * self.row_height
+
+    def space_after(self, total: int) -> int:
+        return (total - self.stop) * self.row_height
+
+    def update(
+        self,
+        rows: Children,
+        items: Sequence[Any],
+        *,
+        scroll_top: float,
+        viewport_height: float,
+        force: bool = False,
+    ) -> bool:
+        start, stop = self.get_range(scroll_top, viewport_height, len(items))
+        if not force and (start, stop) == (self.start, self.stop):
+            return False
+
+        old_start, old_rows = self.start, list(rows)
+        self.start, self.stop = start, stop
+
+        # rows, that are still in the window, keep their items; only the rest are re-used for new items
+        kept = {}
+        free = []
+        for index, row in enumerate(old_rows, old_start):
+            if start <= index < stop:
+                kept[index] = row
+            else:
+                free.append(row)
+
+        new_rows = []
+        for index in range(start, stop):
+            if (row := kept.get(index)) is not None:
+                if force:  # items could be changed
+                    self.update_row(row, items[index], index)
+            elif free:
+                row = free.pop()
+                self.update_row(row, items[index], index)
+            else:
+                row = self.make_row(items[index], index)
+            new_rows.append(row)
+
+        rows[:] = new_rows  # moved rows are re-ordered in the DOM, the rest are removed
+        return True
+
+    def apply_padding(self, element, total: int):
+        """Not mounted rows are replaced with padding, so the scroll height stays the same"""
+        element.style.setProperty('padding-top', f'{self.space_before()}px')
+        element.style.setProperty('padding-bottom', f'{self.space_after(total)}px')
+
+    def apply_spacers(self, before, after, total: int):
+        """Not mounted rows are replaced with elements of the same height, e.g. for rows of the table"""
+        before.style.setProperty('height', f'{self.space_before()}px')
+        after.style.setProperty('height', f'{self.space_after(total)}px')
+
+
+class VirtualList(Tag, name='virtual-list', content_tag=None):
+    """
+    Mounts only visible rows of `items`, so very long lists don't freeze the page
+
+    `row_tag` must have state `item`, and optionally state `index`.
+    All rows must have the same height `row_height` in pixels
+
+    >>> class Row(Tag, name='row'):
+    ...     item = state()
+    ...     def content(self):
+    ...         return self.item['title']
+    >>> class Rows(VirtualList):
+    ...     row_tag = Row
+    >>> Rows(items=[...], row_height=24)
+    """
+
+    __slots__ = ('_window',)
+
+    row_tag: type[Tag]
+
+    items = state(type=list)
+    row_height = state(24)
+    overscan = state(5)
+    height = state(400)
+
+    default_style = Style(
+        display='block',
+        overflow_y='auto',
+        height='{height}px',
+    )
+
+    children = [
+        rows := Children(),
+    ]
+
+    _window: VirtualWindow | None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._window = None
+
+    def _make_row(self, item, index):
+        kwargs = {'index': index} if 'index' in self.row_tag._static_attrs else {}
+        return self.row_tag(item=item, **kwargs)
+
+    @staticmethod
+    def _update_row(row, item, index):
+        row.item = item
+        if 'index' in row.attrs:
+            row.index = index
+
+    @items.on('mount', 'change')
+    def sync(self):
+        self._update_window(force=True)
+
+    @on('scroll')
+    def _on_scroll(self):
+        self._update_window()
+
+    def _update_window(self, *, force=False):
+        if self._parent_ is None:
+            return
+
+        if self._window is None or force:
+            self._window = VirtualWindow(self.row_height, self._make_row, self._update_row, self.overscan)
+            force = True
+
+        items = self.items or []
+        el = self.mount_element
+        if self._window.update(
+            self.rows,
+            items,
+            scroll_top=el.scrollTop or 0,
+            viewport_height=el.clientHeight or self.height,
+            force=force,
+        ):
+            self._window.apply_padding(el, len(items))
+
+
+__all__ = ['VirtualWindow', 'VirtualList']
@@ -0,0 +1,178 @@
+"""
+Op-log mode: DOM mutations of the render pass are buffered as opcodes with nodes and arguments,
+and applied by one call of `beepy.applyDomOps` in JS, instead of crossing JS bridge for each of them.
+Enabled by `dom_oplog` in config. Outside of the render pass, or if it's disabled, mutations are applied at once
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from beepy.utils import __config__, js, to_js
+
+if TYPE_CHECKING:
+    from typing import Any
+
+# must be in the same order as `BeePy.domOps` in web/src/beepy.js
+(
+    SET_ATTRIBUTE,
+    REMOVE_ATTRIBUTE,
+    SET_PROPERTY,
+    INSERT_CHILD,
+    INSERT_BEFORE,
+    REMOVE_CHILD,
+    REPLACE_CHILDREN,
+    SET_HTML,
+    REPLACE_HTML,
+) = range(9)
+_MOVES = (INSERT_CHILD, INSERT_BEFORE, REMOVE_CHILD, REPLACE_CHILDREN)
+
+_ops: list[Any] = []  # [opcode, node, argument, argument, ...], 4 items for each operation
+_depth = 0  # nested render passes, buffer is applied when the outer one is finished
+_recording = False
+_moved = False  # some of buffered operations change structure of the DOM
+
+
+def is_recording() -> bool:
+    return _recording
+
+
+@contextmanager
+def recording():
+    """Buffers DOM mutations inside, if op-log mode is enabled"""
+    global _depth, _recording  # noqa: PLW0603 - module-level buffer state
+
+    _depth += 1
+    if _depth == 1:
+        _recording = bool(__config__['dom_oplog'])
+    try:
+        yield
+    finally:
+        _depth -= 1
+        if not _depth:
+            _recording = False
+            sync()
+
+
+@contextmanager
+def paused():
+    """Applies buffered mutations and writes to the DOM at once inside, e.g. for states, stored in the DOM"""
+    global _recording  # noqa: PLW0603 - module-level buffer state
+
+    was_recording, _recording = _recording, False
+    sync()
+    try:
+        yield
+    finally:
+        _recording = was_recording
+
+
+def sync():
+    """Applies buffered mutations, so the DOM could be read"""
+    global _ops, _moved
+
+    if not _ops:
+        return
+
+    ops, _ops, _moved = _ops, [], False
+    js.beepy.applyDomOps(to_js(ops))
+
+
+def sync_moves():
+    """Applies buffered mutations, if structure of the DOM must be read, e.g. `parentElement`"""
+    if _moved:
+        sync()
+
+
+def _push(opcode: int, node, first=None, second=None):
+    global _moved  # noqa: PLW0603 - module-level buffer state
+
+    _ops.extend((opcode, node, first, second))
+    if opcode in _MOVES:
+        _moved = True
+
+
+def set_attribute(node, name: str, value):
+    if _recording:
+        _push(SET_ATTRIBUTE, node, name, value)
+    else:
+        node.setAttribute(name, value)
+
+
+def remove_attribute(node, name: str):
+    if _recording:
+        _push(REMOVE_ATTRIBUTE, node, name)
+    else:
+        node.removeAttribute(name)
+
+
+def set_property(node, name: str, value):
+    if _recording:
+        _push(SET_PROPERTY, node, name, value)
+    else:
+        setattr(node, name, value)
+
+
+def insert_child(node, child, index: int | None = None):
+    if _recording:
+        _push(INSERT_CHILD, node, child, index)
+    else:
+        node.insertChild(child, index)
+
+
+def insert_before(node, child, reference):
+    if _recording:
+        _push(INSERT_BEFORE, node, child, reference)
+    else:
+        node.insertBefore(child, reference)
+
+
+def remove_child(node, child):
+    if _recording:
+        _push(REMOVE_CHILD, node, child)
+    else:
+        node.safeRemoveChild(child)
+
+
+def replace_children(node, child=None):
+    """Removes all children of the node, and inserts the child, if it's passed"""
+    if _recording:
+        _push(REPLACE_CHILDREN, node, child)
+    elif child is None:
+        node.replaceChildren()
+    else:
+        node.replaceChildren(child)
+
+
+def set_html(node, html: str):
+    if _recording:
+        _push(SET_HTML, node, html)
+    else:
+        node.innerHTML = html
+
+
+def replace_html(node, html: str):
+    """Sets `innerHTML`, if it's different; used for content without own element, that replaces parent content"""
+    if _recording:
+        _push(REPLACE_HTML, node, html)
+    elif node.innerHTML != html:
+        node.innerHTML = html
+
+
+__all__ = [
+    'is_recording',
+    'recording',
+    'paused',
+    'sync',
+    'sync_moves',
+    'set_attribute',
+    'remove_attribute',
+    'set_property',
+    'insert_child',
+    'insert_before',
+    'remove_child',
+    'replace_children',
+    'set_html',
+    'replace_html',
+]
@@ -1,16 +1,107 @@
 from __future__ import annotations
 
+import asyncio
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
-from re import Match
+from re import Match, Pattern
+from typing import TYPE_CHECKING
 
-from beepy import Tag, html_attr, on, state, state_move_on
+from beepy import Tag, attr, html_attr, on, oplog, state, state_move_on, tracking
 from beepy.tags import a
 from beepy.types import Children
-from beepy.utils import __config__, js
+from beepy.utils import __config__, js, to_js
 from beepy.utils.dev import _debugger
+from beepy.utils.import_hooks import prefetch_module
 from beepy.utils.internal import lazy_import_cls, reload_requirements
-from beepy.utils.js_py import push_url
+from beepy.utils.js_py import create_once_callable, push_url
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_REGEX_SPECIAL_CHARACTERS = frozenset('.^$*+?{}[]\\|()')
+_QUANTIFIERS = frozenset('*+?{')
+_NAMED_PARAMETER = re.compile(r'\{([A-Za-z_]\w*)(?::((?:[^{}]|\{[^{}]*\})+))?\}')
+
+
+def compile_path(path: str) -> str:
+    """
+    Converts named parameters of the route to regex groups
+
+    >>> compile_path('/users/{user_id}/')  # '/users/(?P<user_id>[^/]+)/'
+    >>> compile_path('/posts/{year:\\d{4}}/')  # '/posts/(?P<year>\\d{4})/'
+    """
+    return _NAMED_PARAMETER.sub(lambda m: f'(?P<{m.group(1)}>{m.group(2) or "[^/]+"})', path)
+
+
+def get_static_prefix(pattern: str) -> str:
+    """Returns the beginning of regex, that matches only itself"""
+    if '|' in pattern:  # alternatives could have different prefixes
+        return ''
+
+    for index, char in enumerate(pattern):
+        if char in _REGEX_SPECIAL_CHARACTERS:
+            # quantifier is applied to the previous character, so it isn't static too
+            return pattern[: index - 1] if char in _QUANTIFIERS and index else pattern[:index]
+    return pattern
+
+
+class RouteMatcher:
+    """
+    Routes, compiled once for the Router class. Static routes are found by the dict lookup.
+    Other routes are pre-filtered by the trie of their static prefixes, and then are checked by compiled regex.
+    Order of routes is kept: the first declared route is the first matched one
+    """
+
+    __slots__ = ('routes', 'basename', '_compiled', '_static', '_trie')
+
+    routes: dict[str, str | type[Tag]]
+    basename: str
+    _compiled: list[tuple[str, str | type[Tag], Pattern]]
+    _static: dict[str, list[int]]  # full path -> indexes of routes
+    _trie: dict[str, dict | list[int]]  # char -> child node;  '' -> indexes of routes with this prefix
+
+    def __init__(self, routes: dict[str, str | type[Tag]], basename: str = ''):
+        self.routes = routes
+        self.basename = basename
+        self._compiled = []
+        self._static = {}
+        self._trie = {}
+
+        for index, (path, tag_cls) in enumerate(routes.items()):
+            pattern = f'{basename}{compile_path(path)}'
+            self._compiled.append((path, tag_cls, re.compile(f'^{pattern}$')))
+
+            if (prefix := get_static_prefix(pattern)) == pattern:
+                self._static.setdefault(pattern, []).append(index)
+                continue
+
+            node = self._trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node.setdefault('', []).append(index)
+
+    def is_actual(self, routes: dict[str, str | type[Tag]], basename: str) -> bool:
+        return self.routes is routes and self.basename == basename and len(self._compiled) == len(routes)
+
+    def _candidates(self, location: str) -> list[int]:
+        candidates = list(self._static.get(location, ()))
+
+        node = self._trie
+        candidates.extend(node.get('', ()))
+        for char in location:
+            if (node := node.get(char)) is None:
+                break
+            candidates.extend(node.get('', ()))
+
+        candidates.sort()
+        return candidates
+
+    def match(self, location: str) -> Iterator[tuple[str, str | type[Tag], Match]]:
+        for index in self._candidates(location):
+            path, tag_cls, pattern = self._compiled[index]
+            if match := pattern.search(location):  # not .match(), because of '|' on the top level
+                yield path, tag_cls, match
 
 
 class WithRouter:
@@ -73,6 +164,7 @@ class Path:
 
 class Link(a, WithRouter):
     to = state(type=str, required=True)
+    prefetch = attr('hover')  # when to load modules of lazy route: 'hover', 'visible' or '' - only on click
     href = html_attr(type=str)
 
     @to.on('init', 'change')
@@ -81,6 +173,17 @@ class Link(a, WithRouter):
             value = self.router.basename + value
         self.href = Path.parse_to(value)
 
+    @prefetch.on('mount')
+    def _prefetch_later(self, value):
+        if not self.router:
+            return
+
+        callback = create_once_callable(lambda *_: asyncio.ensure_future(self.router.prefetch(self.href)))
+        if value == 'visible':
+            js.beepy.onceVisible(self.mount_element, callback)
+        elif value == 'hover':  # not `@on` handler, because hover must not re-render the Link
+            self.mount_element.addEventListener('mouseenter', callback, to_js({'once': True}))
+
     @on('click.prevent')
     async def navigate(self):
         Path.parse(self.router.basename + self.to).push_state()
@@ -88,6 +191,16 @@ class Link(a, WithRouter):
 
 
 class Router(Tag):
+    """
+    Routes are regexes, and could have named parameters: `{name}` matches one segment of the path,
+    `{name:regex}` matches the regex. Values are available in `match` of the route component
+
+    With `keep_alive = N`, last N left route components are not unmounted, but only detached from the DOM,
+    so going back to the same location (with the same query string) re-attaches them with all their states
+    """
+
+    __slots__ = ('_kept_alive', '_route_keys')
+
     basename = ''
     routes: dict[str, str | type[Tag]] = {
         # '/': Root,
@@ -97,11 +210,22 @@ class Router(Tag):
     fallback_tag_cls = None
     single_tag = True
     add_trailing_slash = True
+    keep_alive = 0
+
+    _route_matcher: RouteMatcher | None = None
+    # keys are route path and location with query string, so `?a=1` and `?a=2` get own components
+    _kept_alive: OrderedDict[tuple[str | None, str], Tag]  # detached components, the oldest is the first
+    _route_keys: dict[Tag, tuple[str | None, str]]  # all components, kept alive by this router
 
     children = [
         components := Children(),
     ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._kept_alive = OrderedDict()
+        self._route_keys = {}
+
     def pre_mount(self):
         if __config__['server_side'] == 'server':
             js.beepy.config._ssr_all_routes.extend([self.basename + route for route in self.routes])
@@ -115,6 +239,26 @@ class Router(Tag):
         self._load_children()
         js.beepy.stopLoading()
 
+    async def prefetch(self, pathname: str):
+        """Loads modules of lazy route components for the pathname in background, without mounting them"""
+        for _path, tag_cls, _match in self._get_route_matcher().match(self._normalize_location(pathname)):
+            if isinstance(tag_cls, str):
+                await prefetch_module(tag_cls.rsplit('.', 1)[0])
+            if self.single_tag:
+                break
+
+    def _normalize_location(self, pathname: str) -> str:
+        if self.add_trailing_slash and not pathname.endswith('/'):
+            pathname += '/'
+        return pathname
+
+    @classmethod
+    def _get_route_matcher(cls) -> RouteMatcher:
+        matcher = cls.__dict__.get('_route_matcher')
+        if matcher is None or not matcher.is_actual(cls.routes, cls.basename):
+            matcher = cls._route_matcher = RouteMatcher(cls.routes, cls.basename)
+        return matcher
+
     def import_tag_component(self, tag_cls: str | type[Tag], match, **kwargs):
         try:
             tag_cls: type[Tag] = lazy_import_cls(tag_cls)
@@ -129,35 +273,108 @@ class Router(Tag):
     def add_tag_component(self, tag_cls: str | type[Tag], match, path):  # noqa: ARG002 - arguments for overriding
         self.components.append(self.import_tag_component(tag_cls, match=match))
 
+    def keep_alive_activated(self, component: Tag):
+        """empty method for easy override with code for run after kept alive component is attached again"""
+
+    def keep_alive_deactivated(self, component: Tag):
+        """empty method for easy override with code for run after component is detached and kept alive"""
+
+    def keep_alive_evicted(self, component: Tag):
+        """empty method for easy override with code for run before evicted component is unmounted"""
+
+    def _add_route_component(self, tag_cls, match, path, location, old_components: list[Tag], reused: list[Tag]):
+        if not self.keep_alive:
+            self.add_tag_component(tag_cls, match=match, path=path)
+            return
+
+        key = (path, location + js.location.search)
+        for component in old_components:
+            if self._route_keys.get(component) == key:
+                break
+        else:
+            component = self._kept_alive.get(key)
+
+        if component is not None:
+            self.components.append(component)
+            reused.append(component)
+            return
+
+        length = len(self.components)
+        self.add_tag_component(tag_cls, match=match, path=path)
+        for component in self.components[length:]:
+            self._route_keys[component] = key
+
+    def _swap_kept_alive(self, new_components: list[Tag]):
+        """Detaches left components and attaches kept alive ones, so only the rest is mounted/unmounted"""
+        element = self._children_element
+
+        with self.components.onchange_locker:
+            for component in list(self.components):
+                if component in new_components or (key := self._route_keys.get(component)) is None:
+                    continue
+
+                self.components.remove(component)
+                oplog.remove_child(element, component.mount_element)
+                self._kept_alive[key] = component
+                self.keep_alive_deactivated(component)
+
+            for component in new_components:
+                if (key := self._route_keys.get(component)) is None or self._kept_alive.get(key) is not component:
+                    continue
+
+                del self._kept_alive[key]
+                oplog.insert_child(
+                    element, component.mount_element, len(self.components) + self.components.parent_index
+                )
+                self.components.append(component)
+                tracking.mark_dirty(component)
+                self.keep_alive_activated(component)
+
+        while len(self._kept_alive) > self.keep_alive:
+            self._evict(self._kept_alive.popitem(last=False)[1])
+
+    def _evict(self, component: Tag):
+        del self._route_keys[component]
+        self.keep_alive_evicted(component)
+        component.__unmount__(self._children_element, self)
+
+    def _unmount_(self, element, parent, *, _unsafe=False):
+        while self._kept_alive:
+            self._evict(self._kept_alive.popitem()[1])
+        self._route_keys.clear()
+
+        super()._unmount_(element, parent, _unsafe=_unsafe)
+
     def _load_children(self):
         self._current_render.clear()
 
         old_components = list(self.components)
+        reused = []  # mounted components, that are used for this location again
 
         with self.components.onchange_locker:  # can Locker also be descriptor with auto-replace as in last two lines?
             self.components.clear()
 
-            location = js.location.pathname
-            if self.add_trailing_slash and not location.endswith('/'):
-                location += '/'
+            location = self._normalize_location(js.location.pathname)
 
-            for path, tag_cls in self.routes.items():
-                # TODO: consider support re in some format  /  allow using re.compile() too
-                if match := re.search(f'^{self.basename}{path}$', location):
-                    self.add_tag_component(tag_cls, match=match, path=path)
-                    if self.single_tag:
-                        break
+            for path, tag_cls, match in self._get_route_matcher().match(location):
+                self._add_route_component(tag_cls, match, path, location, old_components, reused)
+                if self.single_tag:
+                    break
 
             if not self.components:
                 if fallback := self.fallback_tag_cls:
-                    self.add_tag_component(fallback, match=None, path=None)
+                    self._add_route_component(fallback, None, None, location, old_components, reused)
                 else:
                     # TODO: maybe create BeePyError?
                     raise ValueError('No route to use!')
 
             for child in self.components:  # TODO: simplify this
+                if child in reused:
+                    continue
                 child._link_parent_attrs(self)
                 child.init(*child._args, _load_children=False, **(child._attrs_defaults | child._kwargs))
 
             new_components, self.components = list(self.components), old_components
+        if self.keep_alive:
+            self._swap_kept_alive(new_components)
         self.components[:] = new_components  # triggers correct onchange handlers
@@ -0,0 +1,50 @@
+import base64
+import hashlib
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+SNAPSHOT_PREFIX = 'beepy-snapshot.'
+SNAPSHOT_TIMEOUT = 300  # seconds, packages are installed from scratch
+
+
+def get_snapshot(base_url: str, index: str) -> tuple[str, bytes, bytes]:
+    """Runs `beepy.makeSnapshot()` on the page in headless browser. Returns name, memory and site-packages archive"""
+    options = Options()
+    options.add_argument('--headless=new')
+
+    driver = webdriver.Chrome(options=options)
+    driver.set_script_timeout(SNAPSHOT_TIMEOUT)
+
+    try:
+        print('[BeePy Snapshot] Processing page', index)
+        driver.get(base_url + index)  # under webdriver beepy is not started automatically
+        name, memory, site_packages = driver.execute_async_script(
+            'const done = arguments[arguments.length - 1];'
+            'beepy.makeSnapshot().then(done, (error) => done([null, String(error), null]))'
+        )
+        if name is None:
+            raise RuntimeError(f'Snapshot was not created: {memory}')
+        return name, base64.b64decode(memory), base64.b64decode(site_packages)
+    finally:
+        driver.quit()
+
+
+def create_snapshot(root: Path, base_url: str, index: str) -> Path:
+    """
+    Writes `<name>.<hash>.bin` (memory of the interpreter with imported packages) and `<name>.<hash>.tar.gz`
+    (installed packages), previous snapshots are removed. Returns path without extension, to use in config
+    """
+    name, memory, site_packages = get_snapshot(base_url, index)
+    digest = hashlib.sha256(memory + site_packages).hexdigest()[:12]
+    path = root / f'{name}.{digest}'
+
+    for old_snapshot in root.glob(f'{SNAPSHOT_PREFIX}*'):
+        old_snapshot.unlink()
+    path.with_name(f'{path.name}.bin').write_bytes(memory)
+    path.with_name(f'{path.name}.tar.gz').write_bytes(site_packages)
+    return path
+
+
+__all__ = ['get_snapshot', 'create_snapshot']
@@ -1,12 +1,14 @@
 import re
+import string
 from collections.abc import Iterable
 from typing import Any, Protocol
 
-from beepy.attrs import attr, state
+from beepy.attrs import state
+from beepy.children import TagRef
 from beepy.context import Context
 from beepy.framework import Tag, __config__
 from beepy.tags import Head
-from beepy.types import AttrValue, safe_html, safe_html_content
+from beepy.types import AttrValue, safe_html_content
 from beepy.utils import js
 from beepy.utils.common import MISSING, get_random_name, log10_ceil, safe_issubclass, to_kebab_case
 
@@ -105,8 +107,31 @@ def dict_to_css(*args, separator='\n', **kwargs):
     return separator.join(dict_to_css_iter(*args, **kwargs))
 
 
+def has_format_fields(template: str) -> bool:
+    return any(field_name is not None for _, field_name, _, _ in string.Formatter().parse(template))
+
+
 def get_reference(tag: Tag):
-    return f'[style-id="{tag.style_id}"]'
+    return f'.{tag.style_id}'
+
+
+def compile_dynamic_properties(styles: dict, dynamic_properties: dict[str, str], prefix: str = '--beepy-') -> dict:
+    """Replaces values with format fields, like '{pos_x}px', with CSS custom properties"""
+    result = {}
+    for key, value in styles.items():
+        if isinstance(value, dict):
+            result[key] = compile_dynamic_properties(value, dynamic_properties, prefix)
+        elif key and isinstance(value, str) and has_format_fields(value):
+            name = next((name for name, template in dynamic_properties.items() if template == value), None)
+            if name is None:
+                name = prefix + re.sub(r'[^\w-]+', '_', value).strip('_')
+                if name in dynamic_properties:  # different templates could have the same name, e.g. '{x}px', '{x} px'
+                    name = f'{name}-{len(dynamic_properties)}'
+                dynamic_properties[name] = value
+            result[key] = f'var({name})'
+        else:
+            result[key] = value
+    return result
 
 
 class Var:
@@ -133,9 +158,49 @@ class StyleRef(AttrValue):
     __view_value__ = __repr__
 
 
-class Raw:
-    def __bool__(self):
-        return False
+class CompiledStyle:
+    """CSS of the Style, built once for the tag name. Class of the parent is the `{__style_class__}` format field"""
+
+    __slots__ = ('id', 'content', 'is_template', 'dynamic_properties')
+
+    _count = 0
+
+    id: int  # is a part of names of CSS custom properties, so nested Tags with other Style don't share them
+    content: str
+    is_template: bool  # selectors have format fields, so each instance has own <style>
+    dynamic_properties: dict[str, str]  # name of CSS custom property -> template of the value
+
+    def __init__(self, styles: dict, tag_name: str, *, is_global: bool = False):
+        CompiledStyle._count += 1
+        self.id = CompiledStyle._count
+        self.dynamic_properties = {}
+
+        if is_global:
+            self.content = dict_to_css(styles, tag_name)
+            self.is_template = False
+            return
+
+        styles = compile_dynamic_properties(styles, self.dynamic_properties, f'--beepy-{self.id}-')
+        content = dict_to_css(styles, f'{tag_name}.{{__style_class__}}', braces=('{{', '}}')).strip()
+        self.is_template = any(
+            field_name not in (None, '__style_class__') for _, field_name, _, _ in string.Formatter().parse(content)
+        )
+        self.content = content
+
+
+class SharedStylesheet:
+    """<style> element with static rules of the Style, shared by all mounted instances of the Tag class"""
+
+    __slots__ = ('compiled', 'element', 'users')
+
+    compiled: CompiledStyle
+    element: js.HTMLElement | None
+    users: int
+
+    def __init__(self, compiled: CompiledStyle):
+        self.compiled = compiled
+        self.element = None
+        self.users = 0
 
 
 class TagWithStyle(Protocol):
@@ -143,18 +208,44 @@ class TagWithStyle(Protocol):
 
 
 class Style(Tag, name='style', content_tag=None, raw_html=True, force_ref=True):
-    __slots__ = ('styles', '_main_style', 'real_parent')
+    """
+    Rules are scoped to the parent by class, which is the same for all instances of the parent's Tag class,
+    so static rules are rendered once per Tag class.
+    Values with format fields, like `left='{pos_x}px'`, are compiled to CSS custom properties,
+    which are set on the parent element, so changes of states don't re-render the stylesheet.
+    Format fields in selectors (e.g. with `get_vars` option) are formatted on every render, in own <style>
+    """
+
+    __slots__ = (
+        'styles',
+        '_main_style',
+        'real_parent',
+        '_compiled',
+        '_stylesheet',
+        '_own_element',
+        '_style_class',
+        '_properties',
+    )
 
     __extra_attributes__ = {
-        'style_id': attr(type=StyleRef),
+        'style_id': state(type=StyleRef),
     }
 
     _global = {
         'styles_count': 1,
     }
+    _class_names: dict[type[Tag], str] = {}
+    # Clones of the Style for each parent share the same TagRef
+    _compiled_styles: dict[tuple[TagRef, str], CompiledStyle] = {}
+    _stylesheets: dict[tuple[type[Tag], TagRef], SharedStylesheet] = {}
 
     options = state(type=dict)
     real_parent: Tag | TagWithStyle | None  # Actually it's only `Tag`;   `TagWithStyle` is used only for type checking
+    _compiled: CompiledStyle | None
+    _stylesheet: SharedStylesheet | None
+    _own_element: js.HTMLElement | None  # is set, when `mount_element` is shared <style> of the SharedStylesheet
+    _style_class: str | None
+    _properties: dict[str, str]  # values of CSS custom properties, that are set on the parent element
 
     @classmethod
     def from_css(cls, _file):
@@ -171,6 +262,11 @@ class Style(Tag, name='style', content_tag=None, raw_html=True, force_ref=True):
         self._content = ''
         self._main_style = False
         self.real_parent = None
+        self._compiled = None
+        self._stylesheet = None
+        self._own_element = None
+        self._style_class = None
+        self._properties = {}
         self.options = {
             'global': False,
             'render_states': True,
@@ -178,42 +274,102 @@ class Style(Tag, name='style', content_tag=None, raw_html=True, force_ref=True):
             'get_vars_callback': get_vars,
         } | options
 
+    @classmethod
+    def _get_class_name(cls, tag_cls: type[Tag]) -> str:
+        if (class_name := cls._class_names.get(tag_cls)) is None:
+            cls._global['styles_count'] += 1
+            class_name = f'{tag_cls._context_name_}-{get_random_name(log10_ceil(cls._global["styles_count"]) + 1)}'
+            cls._class_names[tag_cls] = class_name
+        return class_name
+
+    def _compile(self, parent: Tag) -> CompiledStyle:
+        if self._ref is None:
+            return CompiledStyle(self.styles, parent._tag_name_, is_global=self.options['global'])
+
+        key = (self._ref, parent._tag_name_)
+        if (compiled := self._compiled_styles.get(key)) is None:
+            compiled = CompiledStyle(self.styles, parent._tag_name_, is_global=self.options['global'])
+            self._compiled_styles[key] = compiled
+        return compiled
+
+    def _get_stylesheet(self, parent: Tag) -> SharedStylesheet | None:
+        if self._ref is None or self.options['global'] or self._compiled.is_template:
+            return None
+
+        key = (type(parent), self._ref)
+        if (stylesheet := self._stylesheets.get(key)) is None:
+            stylesheet = self._stylesheets[key] = SharedStylesheet(self._compiled)
+        return stylesheet
+
     def _mount_(self, element, parent, index=None):
         self.real_parent = parent
-        if __config__['style_head']:
+        self._compiled = self._compile(parent)
+        self._stylesheet = stylesheet = self._get_stylesheet(parent) if __config__['style_head'] else None
+
+        if not __config__['style_head']:
+            super()._mount_(element, parent, index)
+        elif stylesheet is None:
             super()._mount_(Head.mount_element, Head)
         else:
-            super()._mount_(element, parent, index)
+            self._own_element = self.mount_element
+            stylesheet.users += 1
+            if stylesheet.element is None:
+                super()._mount_(Head.mount_element, Head)
+                stylesheet.element = self.mount_element
+            else:  # rules are already rendered by other instance, so this one uses the same <style> element
+                self.mount_element = self._children_element = stylesheet.element
+                self.mount_parent = Head.mount_element
+                super(Tag, self)._mount_(Head.mount_element, Head)  # skips inserting of the element
 
     def _unmount_(self, element, parent, *, _unsafe=False):
-        return super()._unmount_(element, parent, _unsafe=True)
+        if (own_element := self._own_element) is None:
+            return super()._unmount_(element, parent, _unsafe=True)
+
+        result = None
+        stylesheet = self._stylesheet
+        stylesheet.users -= 1
+        if not stylesheet.users:
+            stylesheet.element = None
+            result = super()._unmount_(element, parent, _unsafe=True)
+
+        self.mount_element = self._children_element = own_element
+        self._own_element = None
+        return result
 
     def mount(self):
-        styles = {Raw(): '{__VARS__}'} | self.styles
         parent = self.real_parent
+        self._properties = {}
 
+        compiled = self._compiled
         if self.options['global']:  # TODO: add example
-            self._content = dict_to_css(styles, parent._tag_name_)
+            self._content = compiled.content
             return
 
+        class_name = self._get_class_name(type(parent))
         if parent.style_id is None:  # support multiple style children
-            self._global['styles_count'] += 1
-            style_id = get_random_name(log10_ceil(self._global['styles_count']) + 1)
-            parent.style_id = StyleRef(style_id, self)
+            parent.style_id = StyleRef(class_name, self)
             self._main_style = True
-        else:
-            style_id = parent.style_id
-
-        # TODO: is [style-id=] slow? If so, maybe use classes?
-        self._content = dict_to_css(styles, f'{parent._tag_name_}[style-id="{style_id}"]', braces=('{{', '}}'))
+            parent.mount_element.classList.add(class_name)
 
-    @safe_html_content
-    def content(self):
-        if self.options['global'] or not self._content:
-            return self._content
+            style = parent.mount_element.style
+            for name, value in parent.style_id.vars.items():
+                style.setProperty(f'--{name}', value)
 
+        if compiled.is_template:
+            self._global['styles_count'] += 1
+            self._style_class = f'{class_name}-{self._global["styles_count"]}'
+            parent.mount_element.classList.add(self._style_class)
+            self._content = compiled.content
+        elif self._own_element is None or self.mount_element is self._own_element:
+            self._style_class = class_name
+            self._content = compiled.content.format(__style_class__=class_name)
+        else:  # shared <style> is rendered by other instance
+            self._style_class = class_name
+            self._content = ''
+
+    def _get_format_params(self) -> dict[str, Any]:
         parent = self.real_parent
-        params: dict[str, Any] = {'__VARS__': ''}
+        params: dict[str, Any] = {}
 
         if self.options['render_states']:
             params.update(parent._states)
@@ -224,12 +380,29 @@ class Style(Tag, name='style', content_tag=None, raw_html=True, force_ref=True):
         if get_vars := self.options['get_vars_callback']:
             params.update(get_vars(self=parent, ref=get_reference, **params))
 
-        if self._main_style and (vars := parent.style_id.vars):
-            # TODO: add mangling for --var names
-            params['__VARS__'] = dict_to_css({safe_html(f'--{name}'): var for name, var in vars.items()}).strip()[1:-1]
+        return params
+
+    def _render_(self, *args, **kwargs):
+        if self._compiled is not None and self._compiled.dynamic_properties:
+            self._update_dynamic_properties()
+        return super()._render_(*args, **kwargs)
 
-        # TODO: use native css '--var: {}' instead of re-render the whole content
-        return self._content.strip().format(**params)
+    def _update_dynamic_properties(self):
+        """Sets changed values of CSS custom properties on the parent element, without re-render of the stylesheet"""
+        params = self._get_format_params()
+        style = self.real_parent.mount_element.style
+        for name, template in self._compiled.dynamic_properties.items():
+            value = template.format(**params)
+            if self._properties.get(name) != value:
+                style.setProperty(name, value)
+                self._properties[name] = value
+
+    @safe_html_content
+    def content(self):
+        if self._compiled is None or not self._compiled.is_template:
+            return self._content
+
+        return self._content.format(**self._get_format_params(), __style_class__=self._style_class)
 
     def var(self, name, new_value=MISSING):
         parent = self.real_parent
@@ -244,7 +417,11 @@ class Style(Tag, name='style', content_tag=None, raw_html=True, force_ref=True):
         else:
             parent.style_id.vars[name] = new_value
         if parent._mount_finished_:
-            parent.__render__()
+            style = parent.mount_element.style
+            if new_value is None:
+                style.removeProperty(f'--{name}')
+            else:
+                style.setProperty(f'--{name}', new_value)
 
 
 def import_css(file_path):
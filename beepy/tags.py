@@ -11,10 +11,21 @@ from beepy.utils.common import AnyOfType, get_random_name
 AUTO_ID = make_sentinel(var_name='AUTO_ID')
 
 
+class class_attr(html_attr):
+    """Attribute `class`, that keeps class of the Tag's Style"""
+
+    __slots__ = ()
+
+    def _fset(self, instance, value):
+        super()._fset(instance, value)
+        if (style_id := getattr(instance, 'style_id', None)) is not None and hasattr(instance, 'mount_element'):
+            instance.mount_element.classList.add(repr(style_id))
+
+
 class html_tag(Tag, _root=True, content_tag=None):
     contenteditable = html_attr(type=bool)
     id = html_attr(type=str)
-    class_ = html_attr(type=str)
+    class_ = class_attr(type=str)
 
     def _set_ref(self, parent, ref):
         super()._set_ref(parent, ref)
@@ -157,12 +157,11 @@ class TrackableList(Trackable, list):
 
         self._notify_add(slice(0, len(self)), self)
 
-    def sort(self, *, key=..., reverse=...):
+    def sort(self, *, key=None, reverse=False):
         if self.onchange_locker:
             super().sort(key=key, reverse=reverse)
             return
 
-        # TODO: rewrite this after `key=` implemented
         length = len(self)
         self._notify_remove(slice(0, length), self)
 
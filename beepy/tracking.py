@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import beepy
+from beepy import oplog
+from beepy.utils.js_py import queue_microtask
+
+if TYPE_CHECKING:
+    from beepy.attrs import state
+    from beepy.context import Context
+    from beepy.framework import Tag
+    from beepy.types import Renderer
+
+
+class RenderStats:
+    __slots__ = ('rendered', 'skipped', 'attrs_written', 'attrs_skipped', 'content_written', 'content_skipped')
+
+    rendered: int
+    skipped: int
+    attrs_written: int
+    attrs_skipped: int
+    content_written: int
+    content_skipped: int
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.rendered = 0
+        self.skipped = 0
+        self.attrs_written = 0
+        self.attrs_skipped = 0
+        self.content_written = 0
+        self.content_skipped = 0
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f'RenderStats({", ".join(f"{key}={value}" for key, value in self.as_dict().items())})'
+
+
+render_stats = RenderStats()
+
+# Renderers, that are rendering right now; the last one is the reader of states
+# `None` marks the render pass, started by `flush_sync`, so nothing is subscribed to it
+_render_stack: list[Renderer | None] = []
+# Ordered set of Tags, that must be re-rendered with the next flush
+_dirty_tags: dict[Tag, None] = {}
+_flush_scheduled = False
+
+
+def is_rendering() -> bool:
+    return bool(_render_stack)
+
+
+@contextmanager
+def reading(renderer: Renderer | None):
+    _render_stack.append(renderer)
+    try:
+        yield
+    finally:
+        _render_stack.pop()
+
+
+def track(instance: Context, attribute: state):
+    """Subscribe current renderer to changes of `attribute` of the `instance`"""
+    if not _render_stack or (renderer := _render_stack[-1]) is None:
+        return
+
+    if (subscribers := getattr(instance, '_subscribers', None)) is None:
+        return
+
+    if (attribute_subscribers := subscribers.get(attribute)) is None:
+        subscribers[attribute] = {renderer: None}
+    else:
+        attribute_subscribers[renderer] = None
+
+
+def notify(instance: Context, attribute: state):
+    """Mark every renderer, that read `attribute` of the `instance`, as dirty.
+    Subscriptions are one-time: renderer subscribes again on the next render
+    """
+    if not (subscribers := getattr(instance, '_subscribers', None)):
+        return
+
+    for renderer in subscribers.pop(attribute, ()):
+        mark_dirty(renderer)
+
+
+def mark_dirty(renderer: Renderer):
+    renderer._dirty_ = True
+
+    if isinstance(renderer, beepy.framework.Tag):
+        _dirty_tags[renderer] = None
+        _schedule_flush()
+    elif (parent := renderer.parent) is not None:  # ContentWrapper is rendered by its Tag
+        mark_dirty(parent)
+
+
+def _depth(tag: Tag) -> int:
+    depth = 0
+    while (tag := tag._parent_) is not None:
+        depth += 1
+    return depth
+
+
+def _schedule_flush():
+    global _flush_scheduled  # noqa: PLW0603 - module-level scheduler state
+
+    if _flush_scheduled:
+        return
+
+    _flush_scheduled = True
+    queue_microtask(_scheduled_flush)
+
+
+def _scheduled_flush():
+    global _flush_scheduled  # noqa: PLW0603 - module-level scheduler state
+
+    _flush_scheduled = False
+    flush_sync()
+
+
+def flush_sync():
+    """Re-render right now all Tags, that are waiting for the next flush.
+    Parents are rendered before children, so each Tag is rendered at most once
+    """
+    if not _dirty_tags:
+        return
+
+    to_render = sorted(_dirty_tags, key=_depth)
+    _dirty_tags.clear()
+
+    with oplog.recording(), reading(None):
+        for tag in to_render:
+            if tag._dirty_:  # could be already rendered by its parent
+                tag.__render__()
+
+
+__all__ = ['RenderStats', 'render_stats', 'is_rendering', 'reading', 'track', 'notify', 'mark_dirty', 'flush_sync']
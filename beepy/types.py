@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections import defaultdict, deque
+from collections.abc import Callable, Hashable, Iterable
 from functools import wraps
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
+from beepy import oplog, tracking
 from beepy.trackable import TrackableList
 from beepy.utils import __config__, js
-from beepy.utils.common import escape_html
+from beepy.utils.common import escape_html, longest_increasing_subsequence
 
 if TYPE_CHECKING:
     from beepy.children import ChildrenRef
@@ -89,20 +92,40 @@ class WebBase(Renderer, Mounter, ABC):
 
 
 class Children(WebBase, TrackableList):
+    """
+    List of child Tags, that are mounted into the parent Tag
+
+    `key` is used to match children on `sort`, `reverse` and `children[:] = new_children`,
+    so existing DOM elements are moved instead of re-mounting. It could be a name of attribute or a function.
+    By default, children are matched by identity.
+    If the new child has the same key as the old one, the old child is kept and gets states and content of the new one
+
+    Removed children of Tag classes with `pool=` are put to the pool, so the next instances reuse them
+
+    >>> rows = Children(key='row_id')
+    """
+
     # TODO: extend Children from Context too?
-    __slots__ = ('parent', 'parent_index', 'ref', 'mounted')
+    __slots__ = ('parent', 'parent_index', 'ref', 'mounted', 'key')
 
     parent: Tag | None
     parent_index: int
     ref: ChildrenRef | None
     mounted: bool
+    key: Callable[[Tag], Hashable] | None
 
-    def __init__(self, iterable=()):
+    def __init__(self, iterable=(), *, key: str | Callable[[Tag], Hashable] | None = None):
         super().__init__(iterable)
         self.parent = None
         self.parent_index = 0
         self.ref = None
         self.mounted = False
+        self.key = attrgetter(key) if isinstance(key, str) else key
+
+    def copy(self):
+        result = super().copy()
+        result.key = self.key
+        return result
 
     def _as_child(self, parent: Tag | None, *, exists_ok=False):
         from beepy.children import ChildrenRef
@@ -137,13 +160,162 @@ class Children(WebBase, TrackableList):
         child._link_parent_attrs(self.parent)
         child.__mount__(self.parent._children_element, self.parent, key + self.parent_index)
         if self.parent._mount_finished_:
-            child.__render__()
+            tracking.mark_dirty(child)
+
+    def _mount_many(self, key: int, children: list[Tag]):
+        """Mounts children into a DocumentFragment, so they are inserted to the DOM at once and rendered in one pass"""
+        if len(children) < 2:  # noqa: PLR2004 - fragment is useless for one child
+            for index, child in enumerate(children, key):
+                self._notify_add_one(index, child)
+            return
+
+        if not self.mounted and not self.parent:
+            return
+
+        parent = self.parent
+        element = parent._children_element
+        fragment = js.document.createDocumentFragment()
+        for child in children:
+            child._link_parent_attrs(parent)
+            child.__mount__(fragment, parent)
+
+        oplog.insert_child(element, fragment, key + self.parent_index)
+
+        for child in children:
+            child.mount_parent = element
+            if parent._mount_finished_:
+                tracking.mark_dirty(child)
+
+    def extend(self, __iterable):
+        if self.onchange_locker:
+            super().extend(__iterable)
+            return
+
+        length = len(self)
+        with self.onchange_locker:
+            super().extend(__iterable)
+
+        if added := self[length:]:
+            self._mount_many(length, added)
+            self.onchange()
 
     def _notify_remove_one(self, _key: int, child: Tag):
         if not self.mounted and not self.parent:
             return
 
         child.__unmount__(self.parent._children_element, self.parent)
+        child._release_()
+
+    def _get_key(self, child: Tag) -> Hashable:
+        return child if self.key is None else self.key(child)
+
+    def sort(self, *, key=None, reverse=False):
+        if self.onchange_locker:
+            super().sort(key=key, reverse=reverse)
+            return
+
+        old_children = list(self)
+        with self.onchange_locker:
+            super().sort(key=key, reverse=reverse)
+        self._reconcile(old_children)
+
+    def reverse(self):
+        if self.onchange_locker:
+            super().reverse()
+            return
+
+        old_children = list(self)
+        with self.onchange_locker:
+            super().reverse()
+        self._reconcile(old_children)
+
+    def __setitem__(self, key, value):
+        if self.onchange_locker or key != slice(None):
+            super().__setitem__(key, value)
+            return
+
+        old_children = list(self)
+        with self.onchange_locker:
+            super().__setitem__(key, value)
+        self._reconcile(old_children)
+
+    def _reconcile(self, old_children: list[Tag]):
+        """Applies current order of children to the DOM with minimal count of moves, inserts and deletions"""
+        if not self.mounted and not self.parent:
+            return
+
+        children, old_indexes, removed = self._match_by_key(old_children)
+
+        with self.onchange_locker:
+            super().__setitem__(slice(None), children)
+
+        if not removed and old_indexes == list(range(len(old_children))):
+            return  # order is not changed
+
+        oplog.sync_moves()
+        # DOM node right after the last child; all children will be inserted before it
+        anchor = old_children[-1].mount_element.nextSibling if old_children else None
+
+        self._unmount_many(removed)
+
+        if not old_children:
+            self._mount_many(0, children)
+            self.onchange()
+            return
+
+        self._move_unstable(children, old_indexes, anchor)
+
+        if removed:
+            self._notify_post_remove()
+        self.onchange()
+
+    def _match_by_key(self, old_children: list[Tag]) -> tuple[list[Tag], list[int], list[Tag]]:
+        """
+        Children to keep in the new order, with old children reused for the same keys,
+        index of each one in old_children (-1 for new child) and old children to remove
+        """
+        old_by_key: defaultdict[Hashable, deque[tuple[int, Tag]]] = defaultdict(deque)
+        for index, child in enumerate(old_children):
+            old_by_key[self._get_key(child)].append((index, child))
+
+        children = []
+        old_indexes = []
+        for new_child in self:
+            if not (same_key := old_by_key.get(self._get_key(new_child))):
+                children.append(new_child)
+                old_indexes.append(-1)
+                continue
+
+            old_index, child = same_key.popleft()
+            if child is not new_child:
+                child._reuse_as(new_child)
+            children.append(child)
+            old_indexes.append(old_index)
+
+        removed = [child for same_key in old_by_key.values() for _, child in same_key]
+        return children, old_indexes, removed
+
+    def _unmount_many(self, children: list[Tag]):
+        element = self.parent._children_element
+        for child in children:
+            child.__unmount__(element, self.parent)
+            child._release_()
+
+    def _move_unstable(self, children: list[Tag], old_indexes: list[int], anchor: js.HTMLElement | None):
+        """Moves children outside of the longest increasing subsequence of old indexes, mounts new ones"""
+        element = self.parent._children_element
+        stable = longest_increasing_subsequence(old_indexes)
+        for index in reversed(range(len(children))):
+            child = children[index]
+            if old_indexes[index] == -1:
+                child._link_parent_attrs(self.parent)
+                child.__mount__(element, self.parent)
+                oplog.insert_before(element, child.mount_element, anchor)
+                if self.parent._mount_finished_:
+                    tracking.mark_dirty(child)
+            elif index not in stable:
+                oplog.insert_before(element, child.mount_element, anchor)
+            anchor = child.mount_element
 
     def __render__(self):
         for child in self:
@@ -2,6 +2,9 @@ import inspect
 import math
 import re
 import string
+from bisect import bisect_left
+from contextlib import suppress
+from functools import lru_cache
 
 from boltons.typeutils import make_sentinel
 
@@ -23,6 +26,7 @@ def wraps_with_name(name):
     return wrapper
 
 
+@lru_cache(maxsize=1024)
 def _internal_to_kebab_case(name: str, *, replacer='-'):
     return re.sub(
         r'(?P<upper>[A-Z])', lambda m: replacer + m.group('upper').lower(), re.sub('[_ ]', replacer, name.strip('_ '))
@@ -107,13 +111,57 @@ class Locker:
         return f'Locker<{self.name}>({self.locked})'
 
 
-def call_handler_with_optional_arguments(handler, obj, optional_args, *args):
-    parameters = inspect.signature(handler).parameters
+def get_optional_arguments(handler, names):
+    """
+    Returns names of `names`, that are parameters of `handler`.
+    Result is cached in the underlying function, so `inspect.signature` is called once per function
+    """
+    function = getattr(handler, '__func__', handler)
+    key = (function is not handler, names)
+
+    try:
+        plans = function._optional_arguments_
+    except AttributeError:
+        plans = {}
+        with suppress(AttributeError, TypeError):  # e.g. builtin function
+            function._optional_arguments_ = plans
+
+    if (plan := plans.get(key)) is None:
+        parameters = inspect.signature(handler).parameters
+        plan = plans[key] = tuple(name for name in names if name in parameters)
+    return plan
 
-    for name, arg in reversed(optional_args.items()):
-        if name in parameters:
-            args = (arg, *args)
-    return handler(obj, *args)
+
+def call_handler_with_optional_arguments(handler, obj, optional_args, *args):
+    plan = get_optional_arguments(handler, tuple(optional_args))
+    return handler(obj, *(optional_args[name] for name in plan), *args)
+
+
+def longest_increasing_subsequence(sequence):
+    """Returns set of indexes of the longest strictly increasing subsequence. Negative values are ignored"""
+    tails = []  # index in `sequence` of the smallest tail of subsequence with length i+1
+    tails_values = []
+    previous = [-1] * len(sequence)
+
+    for index, value in enumerate(sequence):
+        if value < 0:
+            continue
+        position = bisect_left(tails_values, value)
+        if position:
+            previous[index] = tails[position - 1]
+        if position == len(tails):
+            tails.append(index)
+            tails_values.append(value)
+        else:
+            tails[position] = index
+            tails_values[position] = value
+
+    result = set()
+    index = tails[-1] if tails else -1
+    while index != -1:
+        result.add(index)
+        index = previous[index]
+    return result
 
 
 def nested_copy(dct):
@@ -131,6 +179,8 @@ __all__ = [
     'safe_issubclass',
     'AnyOfType',
     'Locker',
+    'get_optional_arguments',
     'call_handler_with_optional_arguments',
+    'longest_increasing_subsequence',
     'nested_copy',
 ]
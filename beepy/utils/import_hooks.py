@@ -1,6 +1,9 @@
+import ast
+import asyncio
+import json
 import sys
 from importlib.abc import MetaPathFinder
-from importlib.util import spec_from_file_location
+from importlib.util import resolve_name, spec_from_file_location
 from pathlib import Path
 
 from pyodide.ffi import JsException
@@ -11,7 +14,7 @@ from beepy.utils.internal import __config__, _beepy_root_package
 from beepy.utils.js_py import IN_BROWSER, js
 
 requirements = __config__['requirements']
-_modules_not_existing_on_server = [
+_modules_not_existing_on_server = {
     _beepy_root_package,
     *(requirements() if callable(requirements) else requirements),
     '_hashlib',  # TODO: FIX THIS...
@@ -45,8 +48,14 @@ _modules_not_existing_on_server = [
     '_decimal',
     'http',
     'ssl',
-]
+}
 # some modules must be ignored to prevent load it from local server, when importing modules like micropip or datetime
+_MISSING_MODULES_STORAGE_PREFIX = 'beepy::missing_modules::'
+_missing_modules_storage_key: str | None = None  # None, if missing modules are not saved between page loads
+_missing_modules_found: set[str] = set()
+_preloaded_modules: dict[str, str] = js.beepy.preloadedModules.to_py() if IN_BROWSER else {}  # module -> file
+_prefetched_modules: dict[str, tuple[str, str]] = {}  # module -> (path on the server, loaded file)
+_prefetching: set[str] = set()
 
 
 class ServerFinder(MetaPathFinder):
@@ -54,10 +63,19 @@ class ServerFinder(MetaPathFinder):
         if path and any(p.startswith('/lib') for p in path):
             return
 
-        if Path(f'/lib/python3.11/site-packages/{fullname}').exists() or fullname in _modules_not_existing_on_server:
+        if fullname in _modules_not_existing_on_server or Path(f'/lib/python3.11/site-packages/{fullname}').exists():
             return
 
         Files = js.beepy.files
+        if (file := _preloaded_modules.get(fullname.removeprefix(f'{_beepy_root_package}.'))) is not None:
+            Files._lastLoadedFile = file  # already in FS, imports of this module are resolved relative to it
+            return
+
+        prefetched = _prefetched_modules.get(fullname)
+        if prefetched and prefetched[0] == js.beepy.resolveModulePath(fullname)[0]:  # file is already in FS
+            Files._lastLoadedFile = prefetched[1]  # imports of this module are resolved relative to it
+            return
+
         current_path = Files._lastLoadedFile
         Files._devExtraQuery = get_random_name(3)
 
@@ -67,12 +85,107 @@ class ServerFinder(MetaPathFinder):
             Files._lastLoadedFile = current_path
             Files._devExtraQuery = ''
             _debugger(err)
-            _modules_not_existing_on_server.append(fullname)
+            if err.name == 'FileNotFoundError':
+                _remember_missing_module(fullname)
+            else:  # errors of the network or the server could be temporary, so it's not saved between page loads
+                _modules_not_existing_on_server.add(fullname)
             return
 
         return spec_from_file_location(fullname)
 
 
+def _load_missing_modules():
+    """Modules, not found on the server, are saved in localStorage, until version of the app or BeePy is changed"""
+    global _missing_modules_storage_key  # noqa: PLW0603 - initialized once on start
+
+    if __config__['development']:  # files could be added at any time
+        return
+
+    _missing_modules_storage_key = f'{_MISSING_MODULES_STORAGE_PREFIX}{js.beepy.__version__}:{js.beepy.appVersion}'
+    for key in list(js.Object.keys(js.localStorage)):
+        if key.startswith(_MISSING_MODULES_STORAGE_PREFIX) and key != _missing_modules_storage_key:
+            js.localStorage.removeItem(key)
+
+    _missing_modules_found.update(json.loads(js.localStorage.getItem(_missing_modules_storage_key) or '[]'))
+    _modules_not_existing_on_server.update(_missing_modules_found)
+
+
+def _remember_missing_module(fullname):
+    """Module is saved as missing, only if the server responded with 404"""
+    _modules_not_existing_on_server.add(fullname)
+    _missing_modules_found.add(fullname)
+    if _missing_modules_storage_key is not None:
+        js.localStorage.setItem(_missing_modules_storage_key, json.dumps(sorted(_missing_modules_found)))
+
+
+def _may_be_on_server(fullname):
+    top_level = fullname.partition('.')[0]
+    return not (
+        fullname in sys.modules
+        or fullname in _preloaded_modules
+        or fullname in _modules_not_existing_on_server
+        or top_level in sys.stdlib_module_names
+        or Path(f'/lib/python3.11/site-packages/{top_level}').exists()
+    )
+
+
+def _get_imported_modules(source: str, fullname: str, *, is_package: bool) -> set[str]:
+    """Names of modules, imported by the source, with all their parent packages"""
+    package = fullname if is_package else fullname.rpartition('.')[0]
+    result = set()
+
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                module = resolve_name('.' * node.level + (node.module or ''), package)
+            except (ImportError, ValueError):
+                continue
+            # `from . import name` imports submodule
+            names = [f'{module}.{alias.name}' for alias in node.names] if node.module is None else [module]
+        else:
+            continue
+
+        for name in names:
+            parts = name.split('.')
+            result.update('.'.join(parts[:length]) for length in range(1, len(parts) + 1))
+
+    return result
+
+
+async def _prefetch_one(fullname: str, current_file: str | None):
+    if fullname in _prefetched_modules or fullname in _prefetching or not _may_be_on_server(fullname):
+        return
+
+    _prefetching.add(fullname)
+    try:
+        server_path, file_path, source = (await js.beepy.prefetchModule(fullname, current_file)).to_py()
+    except JsException:  # it's only a guess, ServerFinder will try again on import, maybe with other current path
+        return
+    finally:
+        _prefetching.discard(fullname)
+
+    _prefetched_modules[fullname] = (server_path, file_path)
+
+    try:
+        imported = _get_imported_modules(source, fullname, is_package=file_path.endswith('__init__.py'))
+    except SyntaxError:
+        return
+    await asyncio.gather(*(_prefetch_one(name, file_path) for name in imported))
+
+
+async def prefetch_module(fullname: str, current_file: str | None = None):
+    """
+    Loads module with the whole tree of its imports to FS in background, all files are loaded in parallel.
+    Then ServerFinder imports it without blocking synchronous request
+    """
+    parts = fullname.split('.')
+    packages = ['.'.join(parts[:length]) for length in range(1, len(parts) + 1)]
+    await asyncio.gather(*(_prefetch_one(name, current_file) for name in packages))
+
+
 if IN_BROWSER:
+    _load_missing_modules()
     sys.meta_path.insert(0, ServerFinder())
     sys.path.append(_beepy_root_package)
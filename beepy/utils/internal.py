@@ -5,9 +5,6 @@ import sys
 from importlib import import_module
 from typing import TYPE_CHECKING
 
-import dotenv
-import micropip
-
 from beepy.utils.js_py import IN_BROWSER, js, to_js
 
 if TYPE_CHECKING:
@@ -16,7 +13,11 @@ if TYPE_CHECKING:
 _beepy_root_package = '__beepy_root__'
 _py_tag_attribute = '__PYTHON_TAG__'
 
-dotenv.load_dotenv(f'{_beepy_root_package}/.env' if IN_BROWSER else '.env')
+_env_path = f'{_beepy_root_package}/.env' if IN_BROWSER else '.env'
+if os.path.exists(_env_path):  # noqa: PTH110 - dotenv is imported only if there is something to load
+    import dotenv
+
+    dotenv.load_dotenv(_env_path)
 
 # TODO: make it with dataclass?
 # TODO: consider using .toml/.yaml usage instead of .env + window.beepy.config
@@ -28,6 +29,7 @@ __config__ = {
     'default_datetime_format': '%Y-%m-%dT%H:%M:%S.%f%Z',
     'inputs_auto_id': True,
     'html_replace_whitespaces': True,
+    'dom_oplog': False,  # DOM mutations of the render pass are applied at once, see `beepy.oplog`
     'random_seed': int(os.environ.get('RANDOM_SEED', 0)),
     'server_side': '',
     'requirements': [],
@@ -48,6 +50,8 @@ async def reload_requirements():
     if not callable(get_requirements):  # static requirements, must be already loaded
         return
 
+    import micropip  # takes a lot of time to import, but is rarely needed
+
     await asyncio.gather(*[micropip.install(requirement) for requirement in get_requirements()])
 
 
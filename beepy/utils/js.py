@@ -4,6 +4,7 @@ This file is partly mock of JS API, created to make possible run and debug BeePy
 
 from __future__ import annotations
 
+import html
 import time
 from collections import defaultdict
 from collections.abc import Callable
@@ -16,6 +17,38 @@ except ImportError:
     from pyodide import IN_BROWSER, create_once_callable, create_proxy
 
 
+class CSSStyleDeclaration(dict):
+    def setProperty(self, name, value):
+        self[name] = value
+
+    def removeProperty(self, name):
+        return self.pop(name, '')
+
+    def getPropertyValue(self, name):
+        return self.get(name, '')
+
+    def __str__(self):
+        return ' '.join(f'{name}: {value};' for name, value in self.items())
+
+
+class DOMTokenList:
+    def __init__(self, element: HTMLElement):
+        self.element = element
+
+    def _tokens(self):
+        return (self.element.getAttribute('class') or '').split()
+
+    def add(self, *tokens):
+        current = self._tokens()
+        self.element.setAttribute('class', ' '.join(current + [token for token in tokens if token not in current]))
+
+    def remove(self, *tokens):
+        self.element.setAttribute('class', ' '.join(token for token in self._tokens() if token not in tokens))
+
+    def contains(self, token):
+        return token in self._tokens()
+
+
 class HTMLElement:
     __PYTHON_TAG__: Tag
 
@@ -25,8 +58,14 @@ class HTMLElement:
         self.listeners = defaultdict(list)
         self.tagName = tag_name
         self.clientWidth = self.clientHeight = self.scrollWidth = self.scrollHeight = 1
+        self.scrollTop = self.scrollLeft = 0
+        self.style = CSSStyleDeclaration()
         self.parentElement = _parent
 
+    @property
+    def classList(self):
+        return DOMTokenList(self)
+
     def getAttribute(self, name):
         return self.attributes.get(name)
 
@@ -44,6 +83,17 @@ class HTMLElement:
         self.data.append(el)
 
     def insertChild(self, el: HTMLElement | str, index: int = None):
+        if isinstance(el, Fragment) and el.data:  # like in the DOM, children of the fragment are moved
+            children, el.data = el.data, []
+            for child in children:
+                if not isinstance(child, str):
+                    child.parentElement = self
+            if index is None:
+                self.data.extend(children)
+            else:
+                self.data[index:index] = children
+            return
+
         if not isinstance(el, str):
             el.parentElement = self
 
@@ -54,10 +104,39 @@ class HTMLElement:
 
     def removeChild(self, child: HTMLElement):
         self.data.remove(child)
+        if not isinstance(child, str):
+            child.parentElement = None
+
+    def replaceChildren(self, *children: HTMLElement | str):
+        for child in self.data:
+            if not isinstance(child, str):
+                child.parentElement = None
+        self.data = list(children)
+        for child in children:
+            if not isinstance(child, str):
+                child.parentElement = self
 
     def safeRemoveChild(self, child: HTMLElement):
         if child in self.data:
-            self.data.remove(child)
+            self.removeChild(child)
+
+    def insertBefore(self, el: HTMLElement, reference: HTMLElement | None):
+        if el.parentElement is not None and el in el.parentElement.data:
+            el.parentElement.data.remove(el)
+        el.parentElement = self
+
+        if reference is None:
+            self.data.append(el)
+        else:
+            self.data.insert(self.data.index(reference), el)
+
+    @property
+    def nextSibling(self):
+        if self.parentElement is None or self not in self.parentElement.data:
+            return None
+        siblings = self.parentElement.data
+        index = siblings.index(self) + 1
+        return siblings[index] if index < len(siblings) else None
 
     def replaceChild(self, newChild: HTMLElement, oldChild: HTMLElement):
         self.data[self.data.index(oldChild)] = newChild
@@ -65,7 +144,24 @@ class HTMLElement:
     def remove(self):
         self.parentElement.removeChild(self)
 
-    def addEventListener(self, name, js_proxy):
+    def cloneNode(self, deep=False):  # noqa: FBT002 - same as in JS
+        clone = HTMLElement.__new__(type(self))
+        HTMLElement.__init__(clone, self.tagName)
+        clone.attributes = self.attributes.copy()
+        clone.style = CSSStyleDeclaration(self.style)
+        for child in self.data if deep else ():
+            if not isinstance(child, str):
+                child = child.cloneNode(deep=True)  # noqa: PLW2901 - cloned child replaces original
+                child.parentElement = clone
+            clone.data.append(child)
+        return clone
+
+    def contains(self, other: HTMLElement):
+        while other is not None and other is not self:
+            other = other.parentElement
+        return other is self
+
+    def addEventListener(self, name, js_proxy, options=None):  # noqa: ARG002 - same as in JS
         self.listeners[name].append(js_proxy)
 
     @property
@@ -84,6 +180,8 @@ class HTMLElement:
         attrs = ' '
         for key, value in self.attributes.items():
             attrs += f'{key}="{value}" '
+        if self.style:
+            attrs += f'style="{self.style}" '
         attrs = attrs.strip(' ')
         if attrs:
             attrs = ' ' + attrs
@@ -104,6 +202,21 @@ class Element(HTMLElement):
     pass
 
 
+class Text:
+    def __init__(self, data):
+        self.nodeValue = data
+        self.parentElement = None
+
+    def cloneNode(self, deep=False):  # noqa: FBT002, ARG002 - same as in JS
+        return Text(self.nodeValue)
+
+    def __str__(self):
+        return html.escape(self.nodeValue, quote=False)
+
+    def __repr__(self):
+        return f'Text({self.nodeValue!r})'
+
+
 class Console:
     def log(self, *a):
         _ = (self,)
@@ -136,6 +249,9 @@ class Document:
     def createDocumentFragment(self):
         return Fragment()
 
+    def createTextNode(self, data):
+        return Text(data)
+
 
 class Location:
     pathname = '/e/'  # must be dynamic
@@ -205,7 +321,7 @@ async def delay(ms):
 
 class LocalStorage(dict):
     def getItem(self, key):
-        return self[key]
+        return self.get(key)
 
     def setItem(self, key, value):
         self[key] = value
@@ -280,6 +396,7 @@ def setTimeout(callback, ms):
     def timeout():
         time.sleep(ms / 1000)
         callback()
+        threads['timeout'].pop(id, None)  # finished thread isn't kept
 
     id = max_id['timeout']
     max_id['timeout'] += 1
@@ -296,6 +413,11 @@ def clearTimeout(timeout_id):
         threads_to_join.append(threads['timeout'].pop(timeout_id))
 
 
+@_js_func
+def queueMicrotask(callback):
+    setTimeout(callback, 0)
+
+
 if TYPE_CHECKING:
     from beepy.framework import Tag
 
@@ -315,6 +437,52 @@ class BeePyModule:
     def addAsyncListener(self, el, eventName, method, modifiers, **options):
         return
 
+    def compileTemplate(self, root, nodes):
+        paths = []
+        for node in nodes:
+            path = [] if root.contains(node) else None
+            while path is not None and node is not root:
+                path.insert(0, node.parentElement.data.index(node))
+                node = node.parentElement
+            paths.append(path)
+        content = root.cloneNode(deep=True)
+        elements = [content]
+        for element in elements:
+            element.attributes.clear()
+            element.style = CSSStyleDeclaration()
+            elements.extend(child for child in element.data if not isinstance(child, str))
+        return {'content': content, 'paths': paths}
+
+    def cloneTemplate(self, template):
+        root = template['content'].cloneNode(deep=True)
+        nodes = [root]
+        for path in template['paths']:
+            node = None if path is None else root
+            for index in path or ():
+                node = node.data[index]
+            nodes.append(node)
+        return nodes
+
+    domOps = (
+        lambda node, name, value: node.setAttribute(name, value),
+        lambda node, name, _: node.removeAttribute(name),
+        lambda node, name, value: setattr(node, name, value),
+        lambda node, child, index: node.insertChild(child, index),
+        lambda node, child, reference: node.insertBefore(child, reference),
+        lambda node, child, _: node.safeRemoveChild(child),
+        lambda node, child, _: node.replaceChildren() if child is None else node.replaceChildren(child),
+        lambda node, html, _: setattr(node, 'innerHTML', html),
+        lambda node, html, _: node.innerHTML != html and setattr(node, 'innerHTML', html),
+    )
+
+    def applyDomOps(self, ops):
+        for index in range(0, len(ops), 4):
+            self.domOps[ops[index]](*ops[index + 1 : index + 4])
+
+    def bindTemplate(self, elements, owners):
+        for element, owner in zip(elements, owners, strict=True):
+            element.__PYTHON_TAG__ = owner
+
     class files:
         _lastLoadedFile = ''
 
@@ -39,6 +39,10 @@ class Interval:
         return clear_interval(self._id)
 
 
+def queue_microtask(callback):
+    js.queueMicrotask(create_once_callable(callback))
+
+
 def to_js(obj, dict_converter=js.Object.fromEntries, **kwargs):
     return pyodide_to_js(obj, dict_converter=dict_converter, **kwargs)
 
@@ -63,6 +67,7 @@ __all__ = [
     'add_event_listener',
     'remove_event_listener',
     'Interval',
+    'queue_microtask',
     'to_js',
     'push_url',
     'replace_url',
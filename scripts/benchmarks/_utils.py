@@ -0,0 +1,99 @@
+"""
+Helpers for benchmarks. They are run outside the browser, using mock of JS API from `beepy.utils.js`
+
+Usage: python scripts/benchmarks/<benchmark>.py
+"""
+
+import contextlib
+import io
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import beepy
+from beepy.utils import js
+
+bridge_calls = Counter()
+
+
+@contextlib.contextmanager
+def count_calls(cls, *method_names, target=None):
+    """Counts calls of methods of mocked JS class, e.g. `js.HTMLElement`. If `target` is set, counts only its calls"""
+    originals = {name: getattr(cls, name) for name in method_names}
+
+    def _counted(name, fn):
+        def wrapper(*args, **kwargs):
+            if target is None or args[0] is target:
+                bridge_calls[name] += 1
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    for name, fn in originals.items():
+        setattr(cls, name, _counted(name, fn))
+    bridge_calls.clear()
+    try:
+        yield bridge_calls
+    finally:
+        for name, fn in originals.items():
+            setattr(cls, name, fn)
+
+
+@contextlib.contextmanager
+def count_bridge_calls(*classes):
+    """
+    Counts crossings of JS bridge: calls of methods and writes of attributes of mocked JS classes, made by Python.
+    Calls, made by mocked JS itself, e.g. inside `beepy.applyDomOps`, are not counted
+    """
+    depth = 0
+    originals = {
+        (cls, name): fn
+        for cls in classes
+        for name, fn in [*vars(cls).items(), ('__setattr__', cls.__setattr__)]
+        if callable(fn) and not isinstance(fn, type) and (name == '__setattr__' or not name.startswith('_'))
+    }
+
+    def _counted(name, fn):
+        def wrapper(*args, **kwargs):
+            nonlocal depth
+            if not depth:
+                bridge_calls[name] += 1
+            depth += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                depth -= 1
+
+        return wrapper
+
+    for (cls, name), fn in originals.items():
+        setattr(cls, name, _counted(name, fn))
+    bridge_calls.clear()
+    try:
+        yield bridge_calls
+    finally:
+        for (cls, name), fn in originals.items():
+            if name == '__setattr__' and fn is object.__setattr__:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, fn)
+
+
+def mount_app(tag):
+    """Mounts Tag to the mocked document, without printing of the rendered HTML"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        beepy.mount(tag, '#root')
+    return tag
+
+
+@contextlib.contextmanager
+def timer(title):
+    start = time.perf_counter()
+    yield
+    print(f'{title}: {(time.perf_counter() - start) * 1000:.1f} ms')
+
+
+__all__ = ['js', 'bridge_calls', 'count_calls', 'count_bridge_calls', 'mount_app', 'timer']
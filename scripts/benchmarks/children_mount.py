@@ -0,0 +1,46 @@
+"""Compares mounting of many children one by one (`append`) and at once (`extend`, using DocumentFragment)"""
+
+from _utils import count_calls, js, mount_app, timer
+
+from beepy import Children, Tag, flush_sync, state
+
+ROWS = 10_000
+
+
+class Row(Tag, name='li'):
+    value = state(0)
+
+    def content(self):
+        return str(self.value)
+
+
+class List(Tag, name='ul'):
+    children = [
+        rows := Children(),
+    ]
+
+
+def per_item(app):
+    for index in range(ROWS):
+        app.rows.append(Row(value=index))
+    flush_sync()
+
+
+def bulk(app):
+    app.rows.extend(Row(value=index) for index in range(ROWS))
+    flush_sync()
+
+
+def main():
+    for benchmark in (per_item, bulk):
+        app = mount_app(List())
+        with (
+            count_calls(js.HTMLElement, 'insertChild', target=app.mount_element) as calls,
+            timer(f'{benchmark.__name__} x{ROWS}'),
+        ):
+            benchmark(app)
+        print(f'    insertions into mounted <ul>: {calls["insertChild"]}')
+
+
+if __name__ == '__main__':
+    main()
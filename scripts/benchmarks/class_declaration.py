@@ -0,0 +1,43 @@
+"""Time of declaring Tag subclasses: deep inheritance with many inherited states and many sibling classes"""
+
+from _utils import timer
+
+from beepy import Tag, on, state
+
+DEPTH = 50
+STATES_PER_CLASS = 5
+SIBLINGS = 500
+
+
+def declare_chain():
+    base = Tag
+    for level in range(DEPTH):
+        namespace = {f'state_{level}_{index}': state(index) for index in range(STATES_PER_CLASS)}
+        base = type(base)(f'Level{level}', (base,), namespace, name='div')
+    return base
+
+
+def declare_siblings(base):
+    for index in range(SIBLINGS):
+
+        class Sibling(base, name='span'):
+            value = state(index)
+
+            @on
+            def click(self):
+                self.value += 1
+
+
+def main():
+    with timer(f'{DEPTH} levels of inheritance, {STATES_PER_CLASS} states each'):
+        deepest = declare_chain()
+
+    with timer(f'{SIBLINGS} classes, inherited from Tag'):
+        declare_siblings(Tag)
+
+    with timer(f'{SIBLINGS} classes, inherited from {DEPTH} levels ({len(deepest._static_attrs)} inherited states)'):
+        declare_siblings(deepest)
+
+
+if __name__ == '__main__':
+    main()
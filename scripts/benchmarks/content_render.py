@@ -0,0 +1,45 @@
+"""Re-render of timer labels every 100ms: unchanged text is skipped, changed text is written to the text node"""
+
+from _utils import count_bridge_calls, js, mount_app, timer
+
+from beepy import Children, Tag, flush_sync, state
+from beepy.tracking import render_stats
+
+LABELS = 100
+TICKS = 100
+
+
+class Timer(Tag, name='span'):
+    ms = state(0)
+
+    def content(self):
+        return f'{self.ms // 1000} s'
+
+
+class Clock(Tag, name='div'):
+    children = [
+        timers := Children(),
+    ]
+
+
+def main():
+    app = mount_app(Clock())
+    app.timers[:] = [Timer() for _ in range(LABELS)]
+    flush_sync()
+    render_stats.reset()
+
+    with (
+        count_bridge_calls(js.HTMLElement, js.Text) as calls,
+        timer(f'{TICKS} ticks of {LABELS} timers'),
+    ):
+        for tick in range(1, TICKS + 1):
+            for label in app.timers:
+                label.ms = tick * 100
+            flush_sync()
+
+    print(f'    content written: {render_stats.content_written}, skipped: {render_stats.content_skipped}')
+    print(f'    bridge crossings: {dict(calls)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Crossings of JS bridge, while rows are re-rendered: each DOM mutation at once vs op-log, applied once per flush
+
+The mock of JS API has no cost of a crossing, so here the op-log is slower, as it also buffers and replays
+the mutations in Python; the count of crossings is what it saves in the browser
+"""
+
+from _utils import count_bridge_calls, js, mount_app, timer
+
+from beepy import Children, Tag, attr, flush_sync, state
+from beepy.utils import __config__
+
+ROWS = 1_000
+UPDATES = 10
+
+
+class Row(Tag, name='li'):
+    value = state(0)
+    kind = attr('even')
+    selected = attr(default=False)
+
+    def content(self):
+        return f'value: {self.value}'
+
+
+class List(Tag, name='ul'):
+    children = [
+        rows := Children(),
+    ]
+
+
+def main():
+    for oplog in (False, True):
+        __config__['dom_oplog'] = oplog
+        app = mount_app(List())
+        app.rows[:] = [Row() for _ in range(ROWS)]
+        flush_sync()
+
+        with (
+            count_bridge_calls(js.HTMLElement, js.Document, js.BeePyModule) as calls,
+            timer(f'op-log {"enabled" if oplog else "disabled"}: {UPDATES} updates of {ROWS} rows'),
+        ):
+            for update in range(1, UPDATES + 1):
+                for row in app.rows:
+                    row.value = update
+                    row.kind = 'even' if update % 2 else 'odd'
+                    row.selected = not update % 3
+                flush_sync()
+
+        print(f'    bridge crossings per update: {sum(calls.values()) / UPDATES:.0f} {dict(calls.most_common(5))}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Time of `import beepy`, measured by `python -X importtime` in a clean interpreter, under the mock of JS API.
+Fails, if import is slower than the budget or heavy optional modules are imported eagerly
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+ROUNDS = 5
+TOP = 10
+BUDGET_MS = 150  # median of cumulative time of `import beepy`
+LAZY_MODULES = ('micropip', 'dotenv', 'beepy.tags', 'beepy.style')  # must not be imported by `import beepy`
+
+
+def import_time(code='import beepy') -> dict[str, tuple[int, int]]:
+    """Module -> (self, cumulative) time of import in microseconds"""
+    with tempfile.TemporaryDirectory() as cwd:  # without .env in the current directory
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=cwd,
+            env={**os.environ, 'PYTHONPATH': str(ROOT)},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix('import time:').split('|')
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def main():
+    startup = import_time('pass')  # modules, imported by the interpreter itself
+    rounds = [import_time() for _ in range(ROUNDS)]
+    totals = sorted(modules['beepy'][1] / 1000 for modules in rounds)
+    median = totals[len(totals) // 2]
+    modules = rounds[len(rounds) // 2]
+
+    print('Slowest modules, imported by `import beepy` (cumulative, ms):')
+    imported = [(name, times) for name, times in modules.items() if name not in startup]
+    for name, (_, cumulative) in sorted(imported, key=lambda item: -item[1][1])[:TOP]:
+        print(f'  {name}: {cumulative / 1000:.1f}')
+    print(f'import beepy: {median:.1f} ms (median of {ROUNDS}, budget {BUDGET_MS} ms)')
+
+    errors = [f'{name} is imported eagerly' for name in LAZY_MODULES if name in modules]
+    if median > BUDGET_MS:
+        errors.append(f'import beepy took {median:.1f} ms, budget is {BUDGET_MS} ms')
+    if errors:
+        sys.exit('\n'.join(errors))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Lookup of the route by location: linear scan of regexes vs precompiled RouteMatcher"""
+
+import re
+
+from _utils import timer
+
+from beepy.router import RouteMatcher, compile_path
+
+LOOKUPS = 1_000
+LINEAR_LOOKUPS = 10_000  # divided by count of routes: linear scan of 1000 routes is too slow
+
+
+def make_routes(count):
+    routes = {'/': 'root'}
+    for index in range(count // 2):
+        routes[f'/section-{index}/'] = f'section_{index}'
+        routes[f'/section-{index}/{{item_id}}/'] = f'item_{index}'
+    return routes
+
+
+def linear_match(routes, location):
+    for path, tag_cls in routes.items():
+        if match := re.search(f'^{compile_path(path)}$', location):
+            return path, tag_cls, match
+    return None
+
+
+def main():
+    for count in (10, 100, 1_000):
+        routes = make_routes(count)
+        last = count // 2 - 1
+        locations = [f'/section-{last}/', f'/section-{last}/42/', '/missing/']
+
+        linear_lookups = LINEAR_LOOKUPS // count
+        with timer(f'{count} routes, linear re.search x{linear_lookups * len(locations)}'):
+            for _ in range(linear_lookups):
+                for location in locations:
+                    linear_match(routes, location)
+
+        with timer(f'{count} routes, compile RouteMatcher'):
+            matcher = RouteMatcher(routes)
+
+        with timer(f'{count} routes, RouteMatcher x{LOOKUPS * len(locations)}'):
+            for _ in range(LOOKUPS):
+                for location in locations:
+                    next(matcher.match(location), None)
+
+
+if __name__ == '__main__':
+    main()
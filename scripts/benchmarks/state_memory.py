@@ -0,0 +1,57 @@
+"""Memory, retained after mount/unmount churn of list rows, and speed of reading states"""
+
+import gc
+import tracemalloc
+
+from _utils import mount_app, timer
+
+from beepy import Children, Tag, flush_sync, state
+
+ROWS = 1_000
+ROUNDS = 10
+READS = 1_000_000
+
+
+class Row(Tag, name='li'):
+    value = state(0)
+    label = state('')
+
+    def content(self):
+        return f'{self.label}: {self.value}'
+
+
+class List(Tag, name='ul'):
+    children = [
+        rows := Children(),
+    ]
+
+
+def churn(app):
+    app.rows.extend(Row(value=index, label='row') for index in range(ROWS))
+    flush_sync()
+    app.rows.clear()
+    flush_sync()
+    gc.collect()
+
+
+def main():
+    app = mount_app(List())
+    churn(app)  # warm up caches, that are filled once
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for round_ in range(1, ROUNDS + 1):
+        churn(app)
+        if round_ in (1, ROUNDS // 2, ROUNDS):
+            retained = tracemalloc.get_traced_memory()[0] - baseline
+            print(f'retained after {round_} rounds of {ROWS} rows: {retained / 1024:.1f} KiB')
+    tracemalloc.stop()
+
+    row = Row(value=1)
+    with timer(f'read state x{READS}'):
+        for _ in range(READS):
+            row.value  # noqa: B018 - reading of state is measured
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Mounting of many instances of a Tag with a big Style: CSS must be built once, not on every mount"""
+
+import time
+
+from _utils import mount_app, timer
+
+from beepy import Children, Style, Tag, flush_sync, state
+from beepy import style as style_module
+from beepy.tags import Head
+from beepy.utils.common import _internal_to_kebab_case
+
+RULES = 200
+MOUNTS = 1_000
+
+
+class Row(Tag, name='row'):
+    value = state(0)
+
+    style = Style(
+        styles={
+            f'.item-{index}': {
+                'font_size': f'{index % 20 + 10}px',
+                'backgroundColor': '#eee',
+                'marginTop': '{value}px',
+                '&:hover': {
+                    'borderLeft': '4px solid #333',
+                },
+            }
+            for index in range(RULES)
+        },
+    )
+
+
+class List(Tag, name='list'):
+    children = [
+        rows := Children(),
+    ]
+
+
+def main():
+    built = 0
+    original_dict_to_css = style_module.dict_to_css
+
+    def counted_dict_to_css(*args, **kwargs):
+        nonlocal built
+        built += 1
+        return original_dict_to_css(*args, **kwargs)
+
+    style_module.dict_to_css = counted_dict_to_css
+    _internal_to_kebab_case.cache_clear()
+
+    app = mount_app(List())
+
+    start = time.perf_counter()
+    app.rows.append(Row(value=0))
+    flush_sync()
+    print(f'first mount: {(time.perf_counter() - start) * 1000:.1f} ms')
+
+    with timer(f'next {MOUNTS - 1} mounts of {RULES}-rule Style'):
+        app.rows.extend(Row(value=index) for index in range(1, MOUNTS))
+        flush_sync()
+
+    print(f'    CSS built: {built} time(s)')
+    print(f'    <style> elements: {sum(getattr(el, "tagName", None) == "style" for el in Head.mount_element.data)}')
+    print(f'    to_kebab_case: {_internal_to_kebab_case.cache_info()}')
+
+
+if __name__ == '__main__':
+    main()
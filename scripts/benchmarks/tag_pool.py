@@ -0,0 +1,57 @@
+"""Re-creating of all rows of a list on every change of data: new Tags vs Tags, reused from the pool"""
+
+from _utils import count_calls, js, mount_app, timer
+
+from beepy import Children, Tag, attr, flush_sync, state
+
+ROWS = 1_000
+UPDATES = 20
+
+
+class Row(Tag, name='li'):
+    value = state(0)
+    kind = attr('row')
+
+    def content(self):
+        return str(self.value)
+
+
+class PooledRow(Row, name='li', pool=ROWS):
+    pass
+
+
+class List(Tag, name='ul'):
+    row_cls = Row
+
+    items = state(type=list)
+
+    children = [
+        rows := Children(),
+    ]
+
+    @items.on('change')
+    def sync(self):
+        self.rows[:] = [self.row_cls(value=item) for item in self.items]
+
+
+class PooledList(List, name='ul'):
+    row_cls = PooledRow
+
+
+def main():
+    for list_cls in (List, PooledList):
+        app = mount_app(list_cls())
+        with (
+            count_calls(js.Document, 'createElement'),
+            count_calls(js.HTMLElement, 'setAttribute') as calls,
+            timer(f'{list_cls.__name__}: {UPDATES} updates of {ROWS} rows'),
+        ):
+            for update in range(UPDATES):
+                app.items = [update * ROWS + index for index in range(ROWS)]
+                flush_sync()
+        print(f'    created elements: {calls["createElement"]}, set attributes: {calls["setAttribute"]}')
+        print(f'    {list_cls.row_cls.pool_stats}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Mounting of many Tags with the same static subtree: created element by element vs cloned from the template"""
+
+from _utils import count_calls, js, mount_app, timer
+
+from beepy import Children, Tag, attr, flush_sync
+from beepy.tags import button, div, footer, h3, header, p, span
+
+CARDS = 1_000
+
+
+class Card(Tag, name='article'):
+    title = attr('')
+
+    children = [
+        header(h3('Title'), span('subtitle')),
+        div(p('First paragraph'), p('Second paragraph')),
+        footer(button('Like'), button('Share')),
+    ]
+
+    def content(self):
+        return self.title
+
+
+class TemplateCard(Card, name='article', template=True):
+    pass
+
+
+class List(Tag, name='section'):
+    children = [
+        cards := Children(),
+    ]
+
+
+def main():
+    for card_cls in (Card, TemplateCard):
+        app = mount_app(List())
+        app.cards.append(card_cls(title='first'))  # template is compiled on the first mount
+        flush_sync()
+        with (
+            count_calls(js.Document, 'createElement'),
+            count_calls(js.HTMLElement, 'insertChild'),
+            count_calls(js.BeePyModule, 'cloneTemplate', 'bindTemplate') as calls,
+            timer(f'{card_cls.__name__}: mount of {CARDS} cards'),
+        ):
+            app.cards[:] = [card_cls(title=str(index)) for index in range(CARDS)]
+            flush_sync()
+
+        per_card = {name: round(count / CARDS, 1) for name, count in calls.items()}
+        print(f'    calls per card: {per_card}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,11 @@
-import {_debugger, _lstrip, addHTMLElement, get_meta, isObjectEmpty, mergeDeep} from './utils'
-import {AsyncFiles, Files, rootFolder, SyncFiles, SyncFiles as StaticFiles} from './files'
+import {_debugger, _lstrip, _toBase64, addHTMLElement, escapeRegExp, get_meta, isObjectEmpty, mergeDeep} from './utils'
+import {AssetCache, StartupTimer} from './cache'
+import {AsyncFiles, FileNotFoundError, Files, rootFolder, SyncFiles, SyncFiles as StaticFiles} from './files'
 import {dev_server} from './dev-server'
 import {python} from './python'
 
 const _script = document.currentScript
+const manifestName = 'beepy-manifest.json'
 let localConfig = {}
 if (!!window.beepy) {
     localConfig = window.beepy
@@ -17,12 +19,21 @@ class BeePy {
     dev_server = dev_server
     dev_path = ''
     python_api = python
+    preloadedModules = {}  // module -> file, loaded by manifest
+    appVersion = ''
+    assetCache = null
+    startup = null
 
     static _default_config = {
         include: ['.env'],
         pyodideVersion: '0.25.1',
         random_seed: get_meta('beepy::config:random_seed') || 0,
         server_side: get_meta('beepy::config:server_side') || '',
+        manifest: get_meta('beepy::config:manifest') || '',  // see `beepy manifest` and `beepy bundle` commands
+        bundle: get_meta('beepy::config:bundle') || '',  // archive, created by `beepy bundle`, to skip manifest request
+        version: get_meta('beepy::config:version') || '',  // version of the app, by default is taken from manifest
+        cache: get_meta('beepy::config:cache') !== 'false',  // keep Pyodide, wheels and app sources in Cache Storage
+        snapshot: get_meta('beepy::config:snapshot') || '',  // interpreter image, created by `beepy snapshot`
         requirements: [],  // also could be function
     }
 
@@ -39,6 +50,7 @@ If you have config, you must define it before loading beepy script
         }
 
         this.config = mergeDeep(BeePy._default_config, localConfig.config || {})
+        this.appVersion = this.config.version
 
         if (!window.navigator.webdriver) {
             this._updateConfig()
@@ -97,6 +109,71 @@ If you have config, you must define it before loading beepy script
         return _listener
     }
 
+    // Op-log of DOM mutations, see `beepy.oplog`; order of operations is the same as opcodes there
+
+    domOps = [
+        (node, name, value) => node.setAttribute(name, value),
+        (node, name) => node.removeAttribute(name),
+        (node, name, value) => { node[name] = value },
+        (node, child, index) => node.insertChild(child, index),
+        (node, child, reference) => node.insertBefore(child, reference),
+        (node, child) => node.safeRemoveChild(child),
+        (node, child) => child == null ? node.replaceChildren() : node.replaceChildren(child),
+        (node, html) => { node.innerHTML = html },
+        (node, html) => { if (node.innerHTML !== html) node.innerHTML = html },
+    ]
+
+    applyDomOps (ops) {
+        // all mutations of the render pass by one call: [opcode, node, argument, argument, ...]
+        for (let index = 0; index < ops.length; index += 4) {
+            this.domOps[ops[index]](ops[index + 1], ops[index + 2], ops[index + 3])
+        }
+    }
+
+    // Templates of Tags, see `template=True` argument of Tag class
+
+    compileTemplate (root, nodes) {
+        // nodes are referenced by path of indexes from root, nodes outside of root (like <style> in <head>) are skipped
+        // template keeps only structure and static text, attributes are set by each instance
+        const template = document.createElement('template')
+        const content = root.cloneNode(true)
+        for (const element of [content, ...content.querySelectorAll('*')]) {
+            for (const name of element.getAttributeNames()) {
+                element.removeAttribute(name)
+            }
+        }
+        template.content.appendChild(content)
+        template.paths = Array.from(nodes, (node) => {
+            if (!root.contains(node)) return null
+            const path = []
+            for (; node !== root; node = node.parentNode) {
+                path.unshift(Array.prototype.indexOf.call(node.parentNode.childNodes, node))
+            }
+            return path
+        })
+        return template
+    }
+
+    cloneTemplate (template) {
+        // the whole subtree is created by one call, returns root and nodes in order of compileTemplate
+        const root = template.content.firstChild.cloneNode(true)
+        const nodes = [root]
+        for (const path of template.paths) {
+            let node = path && root
+            for (const index of path || []) {
+                node = node.childNodes[index]
+            }
+            nodes.push(node)
+        }
+        return nodes
+    }
+
+    bindTemplate (elements, owners) {
+        for (let index = 0; index < elements.length; index++) {
+            elements[index].__PYTHON_TAG__ = owners[index]
+        }
+    }
+
     // Modules
     loadModule (module, {pathToWrite='', addCurrentPath=true}={}) {
         let moduleFile
@@ -118,6 +195,7 @@ If you have config, you must define it before loading beepy script
         try {
             moduleFile = StaticFiles.loadFile(moduleFilePath)
         } catch (e) {
+            if (!(e instanceof FileNotFoundError)) throw e
             moduleFilePath = `${fullPath}.py`
             moduleFile = StaticFiles.loadFile(moduleFilePath)
         }
@@ -125,7 +203,7 @@ If you have config, you must define it before loading beepy script
         if (pathToWrite === '_raw_') {
             pathToWrite = moduleFilePath
         } else if (!pathToWrite) {
-            pathToWrite = moduleFilePath.replace(new RegExp(`^${path}`), fsPath)
+            pathToWrite = moduleFilePath.replace(new RegExp(`^${escapeRegExp(path)}`), fsPath)
         }
         if (pathToWrite.includes('/')) Files.mkDirPath(pathToWrite, true)
 
@@ -134,6 +212,105 @@ If you have config, you must define it before loading beepy script
         return fullPath
     }
 
+    resolveModulePath (module, currentFile=Files._lastLoadedFile) {
+        // path on the server, where `loadModule` looks for the module, if it's called after `currentFile`
+        const lastLoadedFile = Files._lastLoadedFile
+        Files._lastLoadedFile = currentFile
+        try {
+            const [path, parsedModule, fsPath = ''] = Files._parseAndMkDirModule(module, true)
+            return [`${path}${path && parsedModule ? '/' : ''}${parsedModule}`, path, fsPath]
+        } finally {
+            Files._lastLoadedFile = lastLoadedFile
+        }
+    }
+
+    async prefetchModule (module, currentFile=Files._lastLoadedFile) {
+        // the same as `loadModule`, but without blocking. Returns [fullPath, moduleFilePath, moduleFile]
+        const [fullPath, path, fsPath] = this.resolveModulePath(module, currentFile)
+        let moduleFilePath = `${fullPath}/__init__.py`
+        let moduleFile
+
+        try {
+            moduleFile = await AsyncFiles.fetchFile(_lstrip(moduleFilePath), true)
+        } catch (e) {
+            if (!(e instanceof FileNotFoundError)) throw e
+            moduleFilePath = `${fullPath}.py`
+            moduleFile = await AsyncFiles.fetchFile(_lstrip(moduleFilePath), true)
+        }
+
+        const pathToWrite = moduleFilePath.replace(new RegExp(`^${escapeRegExp(path)}`), fsPath)
+        if (pathToWrite.includes('/')) Files.mkDirPath(pathToWrite, true)
+
+        this.dev_server._filePathToModuleAndRealFileCache[moduleFilePath] = [pathToWrite, module]
+        SyncFiles._writeFile(pathToWrite, moduleFile)
+        return [fullPath, moduleFilePath, moduleFile]
+    }
+
+    onceVisible (el, callback) {
+        const observer = new IntersectionObserver((entries) => {
+            if (entries.some((entry) => entry.isIntersecting)) {
+                observer.disconnect()
+                callback()
+            }
+        })
+        observer.observe(el)
+        return observer
+    }
+
+    async preloadModules () {
+        // loads all files from manifest in parallel, so imports don't make synchronous requests
+        if (this.config.bundle) return await this._unpackBundle(this.config.bundle)
+        if (!this.config.manifest) return
+
+        let manifest
+        try {
+            manifest = JSON.parse(await AsyncFiles.fetchFile(this.config.manifest, true))
+        } catch (e) {
+            console.warn(`Manifest ${this.config.manifest} was not loaded`, e)
+            return
+        }
+
+        this.appVersion ||= manifest.version
+        if (manifest.bundle) {
+            return await this._unpackBundle(`${this.config.manifest.replace(/[^/]*$/, '')}${manifest.bundle}`)
+        }
+
+        await Promise.all(manifest.files.map(async (file) => {
+            let content
+            try {
+                content = await AsyncFiles.fetchFile(file, true)
+            } catch (e) {
+                return  // manifest is outdated, this module will be loaded on import, if exists
+            }
+
+            if (file.includes('/')) Files.mkDirPath(file, true)
+            SyncFiles._writeFile(file, content)
+            this._addPreloadedModule(file)
+        }))
+    }
+
+    async _unpackBundle (bundle) {
+        // the whole app is loaded by one request. Name of the bundle contains hash, so it's cached by browser
+        let buffer
+        try {
+            buffer = await AsyncFiles.fetchBuffer(bundle, true)
+        } catch (e) {
+            console.warn(`Bundle ${bundle} was not loaded`, e)
+            return
+        }
+
+        pyodide.unpackArchive(buffer, bundle.endsWith('.zip') ? 'zip' : 'gztar', {extractDir: rootFolder})
+        const manifest = JSON.parse(pyodide.FS.readFile(`${rootFolder}/${manifestName}`, {encoding: 'utf8'}))
+        this.appVersion ||= manifest.version
+        manifest.files.forEach((file) => this._addPreloadedModule(file))
+    }
+
+    _addPreloadedModule (file) {
+        const module = file.replace(/(\/?__init__)?\.py$/, '').replace(/\//g, '.')
+        this.preloadedModules[module] = file
+        if (module) this.dev_server._filePathToModuleAndRealFileCache[file] = [file, module]
+    }
+
     async enterModule (module) {
         Files._enteringModule = module
         try {
@@ -171,7 +348,11 @@ If you have config, you must define it before loading beepy script
         }
 
         try {
-            this.loadModule('')
+            if (options.reload || !('' in this.preloadedModules)) {
+                this.loadModule('')
+            } else {
+                Files._lastLoadedFile = this.preloadedModules['']
+            }
             this.python_api.run(`import ${rootFolder}`)
         } catch (e) {
             console.debug(e)
@@ -191,6 +372,8 @@ If you have config, you must define it before loading beepy script
     async _load_env () {
         let envFileExists = true
         for (const file of this.config.include) {
+            if (pyodide.FS.analyzePath(`${rootFolder}/${file}`).exists) continue  // unpacked from bundle
+
             try {
                 await AsyncFiles._writeFile(Files._parseAndMkDirFile(file).join('/'))
             } catch (e) {
@@ -209,42 +392,153 @@ If you have config, you must define it before loading beepy script
         }
     }
 
-    async _load () {
-        window.removeEventListener('load', this._load)
-        if (window.navigator.webdriver) {
-            this._updateConfig()
+    async _installCache () {
+        if (!this.config.cache || this.__version__ === '0.0a0') return  // local build of beepy is changed often
+
+        this.assetCache = new AssetCache(`${this.__version__}:${this.config.pyodideVersion}`, [this.pyodideIndexURL])
+        try {
+            await this.assetCache.install()
+            AsyncFiles.cache = this.assetCache
+        } catch (e) {
+            console.warn('Cache Storage is not available', e)
+            this.assetCache = null
         }
+    }
 
-        if (this.config.server_side !== 'client') {
-            this.startLoading()
+    // Snapshot: memory of the interpreter with imported packages + archive of site-packages, see `beepy snapshot`
+    static _snapshotCode = `
+import gc, io, site, tarfile
+import micropip, dotenv  # imported modules are saved in the memory snapshot
+buffer = io.BytesIO()
+with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+    archive.add(site.getsitepackages()[0], arcname='.')
+gc.collect()
+buffer.getvalue()
+`
+
+    get _snapshotName () {
+        return `beepy-snapshot.${this.__version__}_${this.config.pyodideVersion}`
+    }
+
+    async makeSnapshot () {
+        // build step, called by `beepy snapshot` in headless browser. Returns [memory, site-packages] in base64
+        this.startup = new StartupTimer()
+        window.pyodide = await window.loadPyodide({ indexURL: this.pyodideIndexURL, _makeSnapshot: true })
+        if (!pyodide.makeMemorySnapshot) throw new Error('Memory snapshots require Pyodide 0.26 or newer')
+
+        await this._installPackages()
+        await this._installBeePy()
+        const sitePackagesProxy = this.python_api.run(BeePy._snapshotCode)
+        const sitePackages = sitePackagesProxy.toJs()
+        sitePackagesProxy.destroy()
+        this.pip.destroy()
+
+        return [this._snapshotName, _toBase64(pyodide.makeMemorySnapshot()), _toBase64(sitePackages)]
+    }
+
+    async _fetchSnapshot () {
+        const snapshot = this.config.snapshot
+        if (!snapshot || this.config.server_side === 'server') return null
+        if (!snapshot.includes(this._snapshotName)) {
+            console.warn(`Snapshot ${snapshot} is made for other version of BeePy or Pyodide, it's skipped`)
+            return null
         }
 
-        window.pyodide = await window.loadPyodide({ indexURL: this.pyodideIndexURL })
+        try {
+            return await Promise.all([
+                AsyncFiles.fetchBuffer(`${snapshot}.bin`, true),
+                AsyncFiles.fetchBuffer(`${snapshot}.tar.gz`, true),
+            ])
+        } catch (e) {
+            console.warn(`Snapshot ${snapshot} was not loaded`, e)
+            return null
+        }
+    }
 
-        pyodide.FS.mkdir(rootFolder)
+    async _loadPyodide () {
+        const snapshot = await this._fetchSnapshot()
+        if (snapshot) {
+            try {
+                window.pyodide = await window.loadPyodide({
+                    indexURL: this.pyodideIndexURL,
+                    _loadSnapshot: snapshot[0],
+                })
+                const sitePackages = this.python_api.run('import site; site.getsitepackages()[0]')
+                pyodide.unpackArchive(snapshot[1], 'gztar', {extractDir: sitePackages})
+                this.pip = pyodide.pyimport('micropip')
+                return true
+            } catch (e) {
+                console.warn('Snapshot was not restored, loading from scratch', e)
+            }
+        }
 
-        this.globals = pyodide.globals
+        window.pyodide = await window.loadPyodide({ indexURL: this.pyodideIndexURL })
+        return false
+    }
+
+    async _installPackages () {
         await pyodide.loadPackage('micropip')
         this.pip = pyodide.pyimport('micropip')
         console.log(pyodide._api.sys.version)
+        this.startup.step('micropip')
 
         let requirements = this.config.requirements
         if (!Array.isArray(requirements)) requirements = requirements()
         await Promise.all(requirements.map(this.pip.install))
+        this.startup.step('requirements')
+    }
 
-        await this._load_env()
-
+    async _installBeePy () {
         if (this.__version__ === '0.0a0') {
             await this.pip.install(`${this.dev_path}/dist/beepy_web-0.0a0-py3-none-any.whl`)
         } else {
             await this.pip.install(`beepy_web==${this.__version__}`)
         }
+        this.startup.step('beepy')
+    }
+
+    async _load () {
+        this.startup = new StartupTimer()
+        window.removeEventListener('load', this._load)
+        if (window.navigator.webdriver) {
+            this._updateConfig()
+        }
+
+        if (this.config.server_side !== 'client') {
+            this.startLoading()
+        }
+
+        await this._installCache()
+        const restoreFetch = this.assetCache ? this.assetCache.patchFetch() : () => null
+        let fromSnapshot
+        try {
+            fromSnapshot = await this._loadPyodide()
+            this.startup.step(fromSnapshot ? 'pyodide (snapshot)' : 'pyodide')
+
+            pyodide.FS.mkdir(rootFolder)
+            const preloading = this.preloadModules()  // in parallel with installing of packages
+
+            this.globals = pyodide.globals
+            if (!fromSnapshot) await this._installPackages()
+
+            await preloading
+            await this._load_env()
+            this.startup.step('app files')
+
+            if (!fromSnapshot) await this._installBeePy()
+        } finally {
+            restoreFetch()  // requests of the app itself are never cached
+        }
 
         this.globals = this.python_api.run(
             'from beepy.utils.internal import _init_js, _BeePyGlobals;_init_js();_BeePyGlobals(globals())'
         )
 
+        this.startup.step('beepy init')
+
         await this._main()
+        this.startup.step('app')
+        this.startup.finish(this.assetCache)
         this.dev_server.init()
     }
 }
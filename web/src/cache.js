@@ -0,0 +1,117 @@
+const cachePrefix = 'beepy::'
+
+
+export class AssetCache {
+    // Cache Storage layer for files, loaded by BeePy, Pyodide and micropip, so warm start doesn't wait for network.
+    // Only these files are cached: other requests of the app could be private, so they are never stored
+    hits = 0
+    misses = 0
+    cache = null
+
+    constructor (name, immutablePrefixes=[]) {
+        this.name = `${cachePrefix}${name}`
+        this.immutablePrefixes = immutablePrefixes.filter(Boolean)
+        this.originalFetch = window.fetch.bind(window)
+    }
+
+    getStrategy (url) {
+        // versioned files are never changed, package indexes are updated in background
+        if (this.immutablePrefixes.some((prefix) => url.startsWith(prefix))) return 'cache-first'
+        if (/\.whl$|\/beepy-(bundle|snapshot)\.[\w.-]+$/.test(url)) return 'cache-first'
+        if (/\/pypi\/[^/]+\/json$|\/simple\/[^/]+\/?$/.test(url)) return 'stale-while-revalidate'
+        return null
+    }
+
+    async install () {
+        if (!window.caches) return  // Cache Storage is available only in secure contexts (https or localhost)
+
+        this.cache = await caches.open(this.name)
+        for (const key of await caches.keys()) {
+            if (key.startsWith(cachePrefix) && key !== this.name) await caches.delete(key)
+        }
+    }
+
+    patchFetch () {
+        // Pyodide and micropip load packages by global `fetch`, so it's replaced only while they are installed,
+        // and only their requests are cached. Returns function, that restores original `fetch`
+        if (!this.cache) return () => null
+
+        const globalFetch = window.fetch
+        window.fetch = (input, init) => this.fetch(this.originalFetch, new Request(input, init))
+        return () => { window.fetch = globalFetch }
+    }
+
+    async fetchAppFile (url, key=url) {
+        // files of the app: sources, manifest and bundle. Sources are used offline, if network is not available.
+        // `key` is url without the query, that is added by BeePy to skip HTTP cache in development
+        const request = new Request(url)
+        if (!this.cache) return await this.originalFetch(request)
+        return await this.fetch(this.originalFetch, request, this.getStrategy(url) || 'network-first', key)
+    }
+
+    async fetch (originalFetch, request, strategy=this.getStrategy(request.url), key=request.url) {
+        if (request.method !== 'GET' || !strategy) return await originalFetch(request)
+
+        if (strategy === 'network-first') {
+            try {
+                return await this._update(originalFetch, request, key)
+            } catch (e) {
+                const cached = await this.cache.match(key)
+                if (!cached) throw e
+                this.hits++
+                return cached
+            }
+        }
+
+        const cached = await this.cache.match(key)
+        if (!cached) {
+            this.misses++
+            return await this._update(originalFetch, request, key)
+        }
+
+        this.hits++
+        if (strategy === 'stale-while-revalidate') this._update(originalFetch, request, key).catch(() => null)
+        return cached
+    }
+
+    async _update (originalFetch, request, key) {
+        const response = await originalFetch(request)
+        if (response.ok) await this.cache.put(key, response.clone())
+        return response
+    }
+}
+
+
+export class StartupTimer {
+    // `beepy.startup.report()` shows how long each step of loading took
+    steps = []
+    total = null
+    cache = null
+
+    constructor () {
+        this.start = this.last = performance.now()
+    }
+
+    step (name) {
+        const now = performance.now()
+        this.steps.push({step: name, ms: Math.round(now - this.last)})
+        this.last = now
+    }
+
+    finish (cache=null) {
+        this.total = Math.round(this.last - this.start)
+        this.cache = cache && cache.cache ? cache : null
+        const cacheInfo = this.cache ? `, cache: ${cache.hits} hits, ${cache.misses} misses` : ''
+        console.info(`[BeePy] Started in ${this.total} ms${cacheInfo}. Details: beepy.startup.report()`)
+    }
+
+    report () {
+        console.table([...this.steps, {step: 'total', ms: this.total}])
+        return {
+            steps: this.steps,
+            total: this.total,
+            cacheHits: this.cache ? this.cache.hits : null,
+            cacheMisses: this.cache ? this.cache.misses : null,
+        }
+    }
+}
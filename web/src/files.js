@@ -57,6 +57,20 @@ export class Files {
 }
 
 
+export class FileNotFoundError extends Error {
+    // only this error means, that the file doesn't exist; errors of the network or the server could be temporary
+    constructor (filePath) {
+        super(`File not found: ${filePath}`)
+        this.name = 'FileNotFoundError'
+    }
+}
+
+function checkStatus (status, filePath) {
+    if (status === 404) throw new FileNotFoundError(filePath)
+    if (status >= 400) throw new Error(`Failed to load file ${filePath}: ${status}`)
+}
+
+
 export class SyncFiles {
     static loadFile (filePath) {
         filePath = _lstrip(filePath)
@@ -67,9 +81,7 @@ export class SyncFiles {
         const req = new XMLHttpRequest()
         req.open('GET', filePath, false)
         req.send(null)
-        if (req.status >= 400 && req.status < 500) {
-            throw new Error('File not found')
-        }
+        checkStatus(req.status, filePath)
         return req.response
     }
 
@@ -81,16 +93,33 @@ export class SyncFiles {
 
 
 export class AsyncFiles {
+    static cache = null  // AssetCache, if it's enabled
+
     static async loadFile (filePath) {
         Files._lastLoadedFile = filePath
-        if (!filePath.includes('http')) filePath = `${window.location.origin}/${filePath}`
-        filePath = `${filePath}${Files._devExtraQuery ? (filePath.includes('?') ? '&':'?') : ''}${Files._devExtraQuery}`
+        return await this.fetchFile(filePath)
+    }
 
-        const r = await fetch(filePath, {method: 'GET'})
-        if (r.status >= 400 && r.status < 500) {
-            throw new Error('File not found')
-        }
-        return await r.text()
+    static async fetchFile (filePath, cached=false) {
+        // doesn't change Files._lastLoadedFile, so it's safe to call in background
+        return await (await this._fetch(filePath, cached)).text()
+    }
+
+    static async fetchBuffer (filePath, cached=false) {
+        return await (await this._fetch(filePath, cached)).arrayBuffer()
+    }
+
+    static async _fetch (filePath, cached=false) {
+        // `cached` is set only for sources, manifest and bundle of the app, other files could be private
+        if (!filePath.includes('http')) filePath = `${window.location.origin}/${filePath}`
+        const separator = Files._devExtraQuery ? (filePath.includes('?') ? '&':'?') : ''
+        const url = `${filePath}${separator}${Files._devExtraQuery}`
+
+        const r = cached && this.cache
+            ? await this.cache.fetchAppFile(url, filePath)  // key is without `_devExtraQuery`
+            : await fetch(url, {method: 'GET'})
+        checkStatus(r.status, url)
+        return r
     }
 
     static async _writeFile (file, content) {
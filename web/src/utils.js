@@ -26,6 +26,10 @@ Element.prototype.safeRemoveChild = function (child) {
     }
 }
 
+// Children are mounted into DocumentFragment, when many of them are added at once
+DocumentFragment.prototype.insertChild = Element.prototype.insertChild
+DocumentFragment.prototype.safeRemoveChild = Element.prototype.safeRemoveChild
+
 Element.prototype.__str__ = function () {
     return `<${this.tagName.toLowerCase()}/>`
 }
@@ -43,6 +47,14 @@ export function addHTMLElement (mountPoint, elementName, options={}) {
     return element
 }
 
+export function _toBase64 (bytes) {
+    let binary = ''
+    for (let index = 0; index < bytes.length; index += 0x8000) {
+        binary += String.fromCharCode(...bytes.subarray(index, index + 0x8000))
+    }
+    return btoa(binary)
+}
+
 export function isObjectEmpty(obj) {
     return Object.keys(obj).length === 0;
 }
@@ -78,6 +90,10 @@ export function _lstrip (text) {
     return text.replace(/^\/+/, '')
 }
 
+export function escapeRegExp (text) {
+    return text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')
+}
+
 export function get_meta (name) {
     const el = document.querySelector(`meta[name="${name}"]`)
     return el ? el.content : ''